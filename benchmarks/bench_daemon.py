@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Daemon benchmark: per-job latency of offline stages, cold CLI vs warm daemon
+Starts a private daemon on a temporary socket and compares a cold CLI run, the
+CLI as a --daemon thin client, and jobs submitted directly over the socket
+
+Usage: python benchmarks/bench_daemon.py [-n JOBS]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO)
+
+from osint_daemon import ping, remote_scan
+
+TARGET = '+919876543210'
+OFFLINE_STAGES = 'basic_info,social_media_search,email_patterns,public_databases,username_patterns,investigation_links'
+
+
+def run_cli(argv):
+    start = time.perf_counter()
+    subprocess.run(argv, cwd=REPO, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Cold CLI vs warm daemon per-job latency')
+    parser.add_argument('-n', '--jobs', type=int, default=20, help='Jobs per mode')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        socket_path = os.path.join(workdir, 'daemon.sock')
+        engagement = os.path.join(workdir, 'engagement.json')
+        with open(engagement, 'w') as f:
+            json.dump({'engagement': 'bench', 'authorized_by': 'bench_daemon.py', 'scope': {'phones': [TARGET]}}, f)
+        common = ['--no-cache', '--quota-ledger', os.path.join(workdir, 'quota.sqlite3')]
+
+        started = time.perf_counter()
+        daemon = subprocess.Popen([sys.executable, 'osint_recon_enhanced.py', 'serve', '--socket', socket_path] + common,
+                                  cwd=REPO, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        try:
+            while ping(socket_path, timeout=0.5) is None:
+                if daemon.poll() is not None:
+                    sys.exit('[-] Daemon exited during startup')
+                time.sleep(0.05)
+            print(f"daemon ready after {time.perf_counter() - started:.2f}s")
+
+            cli = [sys.executable, 'osint_recon_enhanced.py', TARGET, '--only', OFFLINE_STAGES,
+                   '--authorization', engagement, '--format', 'jsonl']
+            cold = [run_cli(cli + common) for _ in range(args.jobs)]
+            thin = [run_cli(cli + ['--daemon', '--socket', socket_path]) for _ in range(args.jobs)]
+            direct = []
+            for _ in range(args.jobs):
+                start = time.perf_counter()
+                remote_scan(TARGET, authorization={'file': engagement}, only=OFFLINE_STAGES.split(','),
+                            socket_path=socket_path)
+                direct.append(time.perf_counter() - start)
+        finally:
+            daemon.terminate()
+            daemon.wait()
+
+    print(f"{'mode':<28} {'median (ms)':>12} {'best (ms)':>10}")
+    for name, samples in (('cold CLI', cold), ('CLI --daemon (thin client)', thin), ('socket job (in-process)', direct)):
+        samples = sorted(samples)
+        print(f"{name:<28} {samples[len(samples) // 2] * 1e3:>12.1f} {samples[0] * 1e3:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
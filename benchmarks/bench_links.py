@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: investigation link generation per target
+Compares the old per-call f-string dicts with the compiled template registry
+
+Usage: python benchmarks/bench_links.py [-n ITERATIONS] [--email EMAIL] [phone ...]
+"""
+
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from osint_links import link_registry, target_fields
+from osint_target import ParsedTarget
+
+DEFAULT_NUMBERS = ['+919876543210', '+14155552671', '+442079460958']
+SECTIONS = ('social_media_search', 'public_databases', 'investigation_links')
+
+
+def links_before(target, email):
+    """The three link stages as f-string dicts (unencoded), as they were built before the registry"""
+    clean_number = target.digits
+    short_number = target.national_number
+    searches = {
+        'Facebook': f'https://www.facebook.com/login/identify?ctx=recover&phone={clean_number}',
+        'Facebook Search': f'https://www.facebook.com/public?query={clean_number}',
+        'LinkedIn': f'https://www.linkedin.com/search/results/all/?keywords={clean_number}',
+        'Twitter': f'https://twitter.com/search?q={clean_number}&src=typed_query',
+        'Instagram': f'https://www.instagram.com/accounts/account_recovery/?phone_number={clean_number}',
+        'WhatsApp': f'https://wa.me/{clean_number}',
+        'Telegram': f'https://t.me/{clean_number}',
+        'Truecaller': f'https://www.truecaller.com/search/in/{short_number}',
+        'Signal': 'https://signal.org/ (Check if number is registered)',
+        'Snapchat': f'https://accounts.snapchat.com/accounts/login?continue=%2Faccounts%2Fwelcome?phone_number=%2B{clean_number}'
+    }
+    if email:
+        searches.update({
+            'Facebook Email': f'https://www.facebook.com/login/identify?ctx=recover&email={email}',
+            'LinkedIn Email': f'https://www.linkedin.com/search/results/all/?keywords={email}',
+            'Twitter Email': f'https://twitter.com/search?q={email}&src=typed_query',
+            'Instagram Email': f'https://www.instagram.com/accounts/account_recovery/?email={email}',
+            'Have I Been Pwned': f'https://haveibeenpwned.com/account/{email}',
+            'Google Search': f'https://www.google.com/search?q="{email}"',
+            'Gravatar': f'https://en.gravatar.com/{email}'
+        })
+    databases = {
+        'IndiaTrace': f'https://www.indiatrace.com/trace-mobile-number-location/trace-mobile-number.php?number={short_number}',
+        'BharatiyaMobile': f'https://trace.bharatiyamobile.com/?numb={short_number}',
+        'Truecaller Web': f'https://www.truecaller.com/search/in/{short_number}',
+        'NumberGuru': f'https://www.numberguru.com/phone/{short_number}',
+        'SpyDialer': f'https://www.spydialer.com/default.aspx?phone={short_number}',
+        'SyncMe': f'https://sync.me/search/?number={short_number}',
+        'Whitepages': f'https://www.whitepages.com/phone/{short_number}',
+        'ZabaSearch': f'https://www.zabasearch.com/phone/{short_number}'
+    }
+    links = {
+        'google_search_phone': f'https://www.google.com/search?q="{target.e164}"',
+        'google_search_short': f'https://www.google.com/search?q="{short_number}"',
+        'duckduckgo_phone': f'https://duckduckgo.com/?q="{target.e164}"',
+        'bing_search': f'https://www.bing.com/search?q="{target.e164}"'
+    }
+    if email:
+        links.update({
+            'google_search_email': f'https://www.google.com/search?q="{email}"',
+            'email_breach_check': 'https://haveibeenpwned.com/',
+            'email_reputation': 'https://www.email-validator.net/'
+        })
+    return searches, databases, links
+
+
+def links_after(target, email, sections=SECTIONS):
+    """The same sections rendered from the registry, sharing one set of encoded fields"""
+    registry = link_registry()
+    fields = target_fields(target, email)
+    return [registry.render(section, fields) for section in sections]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Link generation cost per target')
+    parser.add_argument('numbers', nargs='*', default=DEFAULT_NUMBERS)
+    parser.add_argument('--email', default='first.last+osint@example.com')
+    parser.add_argument('-n', '--iterations', type=int, default=20000)
+    args = parser.parse_args()
+
+    targets = [ParsedTarget.parse(number) for number in args.numbers]
+
+    # First render loads and compiles the template table; report it separately
+    load = timeit.timeit(lambda: links_after(targets[0], args.email), number=1)
+    print(f"registry load + compile + first render: {load * 1e3:.2f} ms")
+
+    count = sum(len(section) for section in links_after(targets[0], args.email))
+    print(f"links per target with email: {count}")
+    print()
+    print(f"{'number':<16} {'f-strings (us)':>15} {'registry (us)':>14} {'one section (us)':>17}")
+    for target in targets:
+        before = min(timeit.repeat(lambda: links_before(target, args.email), number=args.iterations, repeat=3))
+        after = min(timeit.repeat(lambda: links_after(target, args.email), number=args.iterations, repeat=3))
+        one = min(timeit.repeat(lambda: links_after(target, args.email, ('public_databases',)),
+                                number=args.iterations, repeat=3))
+        print(f"{target.e164:<16} {before / args.iterations * 1e6:>15.2f} "
+              f"{after / args.iterations * 1e6:>14.2f} {one / args.iterations * 1e6:>17.2f}")
+
+
+if __name__ == "__main__":
+    main()
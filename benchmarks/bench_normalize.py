@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Normalize benchmark: inventory rows per second by worker count
+Generates a seeded inventory of messy phone numbers and normalizes it with
+1, 2, 4 ... CPU-count worker processes, checking every run writes the same output
+
+Usage: python benchmarks/bench_normalize.py [-n ROWS] [--workers N ...] [--chunk-size N] [--region IN]
+"""
+
+import argparse
+import csv
+import io
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from osint_normalize import DEFAULT_CHUNK_SIZE, normalize_inventory
+
+# Shapes seen in client inventories: spacing, trunk and international prefixes, junk and blanks
+FORMS = (
+    '+91 98765 {five}', '098765{five}', '9876 5{five}', '0091-98765-{five}', '+1 (415) 555-{four}',
+    '(415) 555-{four}', '+44 20 7946 {four}', '+61 2 9374 {four}', 'ext. 2041', '',
+)
+
+
+def inventory(rows, seed):
+    rng = random.Random(seed)
+    out = io.StringIO()
+    writer = csv.writer(out)
+    writer.writerow(['asset_id', 'site', 'phone'])
+    for index in range(rows):
+        number = rng.choice(FORMS).format(five=f'{rng.randrange(10 ** 5):05d}', four=f'{rng.randrange(10 ** 4):04d}')
+        writer.writerow([f'A{index:06d}', rng.choice(('HQ', 'DC1', 'Branch')), number])
+    return out.getvalue()
+
+
+def default_workers():
+    counts, count = [], 1
+    while count < (os.cpu_count() or 1):
+        counts.append(count)
+        count *= 2
+    return counts + [os.cpu_count() or 1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Normalize throughput by worker count')
+    parser.add_argument('-n', '--rows', type=int, default=50000, help='Inventory rows (default: %(default)s)')
+    parser.add_argument('--workers', type=int, action='append', help='Worker count to run (default: 1, 2, 4 ... CPU count)')
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE, help='Rows per job (default: %(default)s)')
+    parser.add_argument('--region', default='IN', help='Region for national numbers (default: %(default)s)')
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    text = inventory(args.rows, args.seed)
+    print(f"{args.rows} rows, chunks of {args.chunk_size}, {os.cpu_count()} CPUs")
+    print(f"{'workers':>7} {'seconds':>9} {'rows/s':>9} {'speedup':>8}")
+    baseline, reference = None, None
+    for workers in args.workers or default_workers():
+        sink = io.StringIO()
+        stats = normalize_inventory(io.StringIO(text), sink, region=args.region, workers=workers,
+                                    chunk_size=args.chunk_size)
+        baseline = baseline or stats.rows_per_second
+        print(f"{workers:>7} {stats.seconds:>9.2f} {stats.rows_per_second:>9.0f} "
+              f"{stats.rows_per_second / baseline:>7.2f}x")
+        if reference is None:
+            reference = sink.getvalue()
+        elif sink.getvalue() != reference:
+            print(f"[-] Output with {workers} workers differs from the first run")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
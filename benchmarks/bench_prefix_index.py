@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Equivalence check and benchmark for the region-restricted prefix index
+Verifies PrefixIndex against phonenumbers' geocoder/carrier/timezone lookups,
+then compares cold first-lookup latency and peak RSS in fresh interpreters
+
+Usage: python benchmarks/bench_prefix_index.py [--regions IN,US] [--samples N]
+Exits 1 if any lookup differs from phonenumbers.
+"""
+
+import argparse
+import os
+import random
+import subprocess
+import sys
+import tempfile
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO)
+
+import phonenumbers
+from osint_prefix_index import PrefixIndex, default_index_path
+
+# Snippets run in a fresh interpreter; each prints seconds from first import to first answer
+# and its own peak RSS (VmHWM is per address space, so it isn't inflated by the forking parent)
+PEAK_RSS = """
+def peak_rss_mib():
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    import resource, sys
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / (1024 * 1024 if sys.platform == 'darwin' else 1024)
+"""
+
+COLD_PHONENUMBERS = PEAK_RSS + """
+import time
+start = time.perf_counter()
+import phonenumbers
+from phonenumbers import carrier, geocoder, timezone
+numobj = phonenumbers.parse({number!r}, None)
+geocoder.description_for_number(numobj, 'en')
+carrier.name_for_number(numobj, 'en')
+timezone.time_zones_for_number(numobj)
+print(time.perf_counter() - start, peak_rss_mib())
+"""
+
+COLD_INDEX = PEAK_RSS + """
+import sys, time
+sys.path.insert(0, {repo!r})
+start = time.perf_counter()
+import phonenumbers
+from osint_prefix_index import PrefixIndex
+index = PrefixIndex.load({path!r})
+numobj = phonenumbers.parse({number!r}, None)
+index.description_for_number(numobj)
+index.name_for_number(numobj)
+index.time_zones_for_number(numobj)
+print(time.perf_counter() - start, peak_rss_mib())
+"""
+
+
+def sample_numbers(regions, samples, seed=0):
+    """Example numbers of every type per region, plus random numbers under each calling code"""
+    rng = random.Random(seed)
+    numbers = []
+    for region in regions:
+        for number_type in range(phonenumbers.PhoneNumberType.UNKNOWN + 1):
+            example = phonenumbers.example_number_for_type(region, number_type)
+            if example is not None:
+                numbers.append(example)
+        cc = phonenumbers.country_code_for_region(region)
+        for _ in range(samples):
+            digits = str(rng.randrange(10 ** 6, 10 ** 11))
+            try:
+                numbers.append(phonenumbers.parse(f'+{cc}{digits}', None))
+            except phonenumbers.NumberParseException:
+                continue
+    return numbers
+
+
+def check_equivalence(index, numbers):
+    """Return the list of (number, expected, actual) mismatches"""
+    from phonenumbers import carrier, geocoder, timezone
+
+    mismatches = []
+    for numobj in numbers:
+        expected = (
+            geocoder.description_for_number(numobj, 'en'),
+            carrier.name_for_number(numobj, 'en'),
+            tuple(timezone.time_zones_for_number(numobj)),
+        )
+        actual = (
+            index.description_for_number(numobj),
+            index.name_for_number(numobj),
+            index.time_zones_for_number(numobj),
+        )
+        if expected != actual:
+            mismatches.append((phonenumbers.format_number(numobj, phonenumbers.PhoneNumberFormat.E164), expected, actual))
+    return mismatches
+
+
+def run_cold(code, runs):
+    """Best in-process seconds and worst peak RSS (MiB) over fresh interpreters"""
+    best, peak = None, 0.0
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, '-c', code], stdout=subprocess.PIPE, check=True).stdout
+        seconds, rss = (float(value) for value in output.split())
+        best = seconds if best is None else min(best, seconds)
+        peak = max(peak, rss)
+    return best, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Prefix index equivalence check and benchmark')
+    parser.add_argument('--regions', default='IN,US', help='Comma-separated regions to index')
+    parser.add_argument('--samples', type=int, default=5000, help='Random numbers per region')
+    parser.add_argument('-n', '--runs', type=int, default=5, help='Fresh interpreters per cold measurement')
+    args = parser.parse_args()
+
+    regions = [region.strip().upper() for region in args.regions.split(',') if region.strip()]
+    with tempfile.TemporaryDirectory() as workdir:
+        index = PrefixIndex.load_or_build(regions, workdir)
+        path = default_index_path(regions, workdir)
+        print(f"[*] Index for {', '.join(index.regions)}: {os.path.getsize(path) / 1024:.0f} KiB on disk, "
+              f"{len(index.geo.prefixes)} geo / {len(index.carrier.prefixes)} carrier / "
+              f"{len(index.tz.prefixes)} tz prefixes")
+
+        numbers = sample_numbers(regions, args.samples)
+        mismatches = check_equivalence(index, numbers)
+        for number, expected, actual in mismatches[:10]:
+            print(f"[-] {number}: phonenumbers={expected} index={actual}")
+        print(f"[{'-' if mismatches else '+'}] {len(numbers) - len(mismatches)}/{len(numbers)} lookups identical")
+
+        number = phonenumbers.format_number(numbers[0], phonenumbers.PhoneNumberFormat.E164)
+        before = run_cold(COLD_PHONENUMBERS.format(number=number), args.runs)
+        after = run_cold(COLD_INDEX.format(repo=REPO, path=path, number=number), args.runs)
+
+    print(f"{'first lookup':<14} {'seconds':>9} {'peak RSS (MiB)':>15}")
+    print(f"{'phonenumbers':<14} {before[0]:>9.3f} {before[1]:>15.1f}")
+    print(f"{'prefix index':<14} {after[0]:>9.3f} {after[1]:>15.1f}")
+
+    if mismatches:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
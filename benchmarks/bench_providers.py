@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Provider benchmark: end-to-end scan latency, per-stage cost and degraded-provider behavior
+Runs full enhanced scans against the local Numverify/HIBP stand-ins (no network needed)
+under healthy, slow, flaky, throttled and down scenarios, with seeded failures
+
+Usage: python benchmarks/bench_providers.py [-n SCANS] [--scenario NAME ...] [--seed N] [--json FILE] [--check]
+
+--check also verifies the transport's behavior in each scenario (retries,
+Retry-After, circuit breaking), and that a scan whose provider hangs past the
+stage timeout lets the process exit within that timeout, and exits non-zero
+if any expectation fails.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from collections import Counter
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO)
+
+from osint_ratelimit import ProviderLimiter
+from osint_recon_enhanced import EnhancedOSINTRecon
+from stand_in_providers import STAND_IN_API_KEY, Behavior, StandIns
+
+TARGET = '+919876543210'
+# Alternates between an account the HIBP stand-in knows as breached and a clean one
+EMAILS = ('pwned.user@example.com', 'clean.user@example.com')
+NETWORK_STAGES = ('enhanced_lookup', 'data_breaches')
+
+SCENARIOS = {
+    'healthy': ('latency=0.03,jitter=0.01', 'latency=0.05,jitter=0.02'),
+    'slow': ('latency=0.4,jitter=0.2', 'latency=0.8,jitter=0.4'),
+    'flaky': ('latency=0.03,errors=0.3', 'latency=0.05,errors=0.3'),
+    'throttled': ('latency=0.03,throttle=0.5,retry_after=0.1', 'latency=0.05,throttle=0.5,retry_after=0.1'),
+    'down': ('latency=0.01,errors=1', 'latency=0.01,errors=1'),
+}
+
+
+def _quiet(event, data):
+    pass
+
+
+def percentile(samples, fraction):
+    samples = sorted(samples)
+    return samples[min(len(samples) - 1, int(fraction * len(samples)))]
+
+
+def run_scenario(name, scans, seed, deadline=None):
+    numverify, hibp = (Behavior.parse(spec) for spec in SCENARIOS[name])
+    with StandIns(numverify, hibp, seed) as stand_ins:
+        # Stand-ins have no rate limits or quotas; the engine's own pacing would dominate otherwise
+        limiter = ProviderLimiter(rates={'numverify': (0, 1), 'hibp': (0, 1)},
+                                  quotas={'numverify': (10 ** 9, 'month')})
+        engine = EnhancedOSINTRecon(api_key=STAND_IN_API_KEY, limiter=limiter, progress=_quiet,
+                                    endpoints=stand_ins.endpoints)
+        walls, stages = [], {}
+        for index in range(scans):
+            start = time.perf_counter()
+            scan = engine.comprehensive_scan(TARGET, EMAILS[index % 2], deadline=deadline)
+            walls.append(time.perf_counter() - start)
+            for result in scan.stages.values():
+                entry = stages.setdefault(result.stage, {'latency': [], 'status': Counter(), 'errors': Counter()})
+                entry['latency'].append(result.latency)
+                entry['status'][result.status] += 1
+                if result.error:
+                    entry['errors'][result.error] += 1
+        breakers = {provider: breaker.opened_at is not None for provider, breaker in engine.session.breakers.items()}
+        return {
+            'scenario': name,
+            'behavior': {'numverify': repr(numverify), 'hibp': repr(hibp)},
+            'scans': scans,
+            'scan_seconds': {'median': percentile(walls, 0.5), 'p95': percentile(walls, 0.95), 'max': max(walls)},
+            'stages': {
+                stage: {'median': percentile(entry['latency'], 0.5), 'p95': percentile(entry['latency'], 0.95),
+                        'status': dict(entry['status']), 'errors': dict(entry['errors'])}
+                for stage, entry in stages.items()
+            },
+            'server_requests': stand_ins.stats(),
+            'breaker_open': breakers,
+        }
+
+
+def check_scenario(result):
+    """(description, passed) expectations for one scenario's result"""
+    stages, requests_seen = result['stages'], result['server_requests']
+    scans = result['scans']
+    checks = []
+    if result['scenario'] in ('healthy', 'slow'):
+        for stage, entry in stages.items():
+            checks.append((f'{stage} ok in every scan', entry['status'].get('ok', 0) == scans))
+    elif result['scenario'] == 'throttled':
+        for provider in ('numverify', 'hibp'):
+            checks.append((f'{provider} was throttled', requests_seen[provider].get(429, 0) > 0))
+        for stage in NETWORK_STAGES:
+            # Two retries at 50% throttling: an occasional call still runs out of attempts
+            checks.append((f'{stage} mostly recovered via Retry-After',
+                           stages[stage]['status'].get('ok', 0) >= scans * 0.7))
+    elif result['scenario'] == 'flaky':
+        for stage in NETWORK_STAGES:
+            checks.append((f'{stage} mostly recovered via retries',
+                           stages[stage]['status'].get('ok', 0) >= scans * 0.7))
+    elif result['scenario'] == 'down':
+        for provider, stage in (('numverify', 'enhanced_lookup'), ('hibp', 'data_breaches')):
+            checks.append((f'{stage} failed in every scan', stages[stage]['status'].get('ok', 0) == 0))
+            # Breaker opens after 3 failed calls of 3 attempts each; nothing reaches the provider after that
+            checks.append((f'{provider} breaker opened', result['breaker_open'].get(provider, False)))
+            checks.append((f'{provider} saw no calls once the breaker opened',
+                           sum(requests_seen[provider].values()) <= 9))
+        local = [stage for stage in stages if stage not in NETWORK_STAGES]
+        checks.append(('offline stages unaffected', all(stages[s]['status'].get('ok', 0) == scans for s in local)))
+    return checks
+
+
+# Child process for check_hung_provider: one scan, then a normal interpreter exit (joining any stage threads)
+HUNG_SCAN = '''
+import sys, time
+from osint_ratelimit import ProviderLimiter
+from osint_recon_enhanced import EnhancedOSINTRecon
+engine = EnhancedOSINTRecon(api_key=sys.argv[1], stage_timeout=float(sys.argv[2]), progress=lambda *a: None,
+                            limiter=ProviderLimiter(rates={'numverify': (0, 1), 'hibp': (0, 1)},
+                                                    quotas={'numverify': (10 ** 9, 'month')}),
+                            endpoints={'numverify': sys.argv[3], 'hibp': sys.argv[4]})
+started = time.time()
+scan = engine.comprehensive_scan(sys.argv[5], sys.argv[6])
+print(started, scan.stages['data_breaches'].status, flush=True)
+'''
+
+
+def check_hung_provider(seed, stage_timeout=1.5, latency=6.0):
+    """(description, passed) checks for a scan whose HIBP calls outlast the stage timeout"""
+    with StandIns(Behavior(latency=0.01), Behavior(latency=latency), seed) as stand_ins:
+        endpoints = stand_ins.endpoints
+        child = subprocess.run([sys.executable, '-c', HUNG_SCAN, STAND_IN_API_KEY, str(stage_timeout),
+                                endpoints['numverify'], endpoints['hibp'], TARGET, EMAILS[0]],
+                               cwd=REPO, capture_output=True, text=True)
+        exited = time.time()
+    try:
+        started, status = child.stdout.split()
+        started = float(started)
+    except ValueError:
+        return [(f'hung-provider scan ran (stderr: {child.stderr.strip()[-200:]})', False)]
+    # Interpreter teardown gets a little slack; an unbounded stage thread would add seconds
+    elapsed = exited - started
+    print(f"\nhung: hibp latency={latency:g}s, stage timeout {stage_timeout:g}s; "
+          f"process exited {elapsed:.2f}s after the scan started")
+    return [
+        ('data_breaches timed out', status == 'timed_out'),
+        (f'process exited within the stage timeout ({elapsed:.2f}s <= {stage_timeout:g}s + 1s)',
+         elapsed <= stage_timeout + 1.0),
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Scan latency and degraded-provider behavior against local stand-ins')
+    parser.add_argument('-n', '--scans', type=int, default=20, help='Scans per scenario (default: %(default)s)')
+    parser.add_argument('--scenario', action='append', choices=SCENARIOS, help='Scenario to run (default: all)')
+    parser.add_argument('--seed', type=int, default=1, help='Stand-in random seed (default: %(default)s)')
+    parser.add_argument('--deadline', type=float, help='Whole-scan deadline in seconds passed to every scan')
+    parser.add_argument('--json', metavar='FILE', help='Also write the raw results as JSON')
+    parser.add_argument('--check', action='store_true', help='Verify retry/breaker behavior; exit 1 on failure')
+    args = parser.parse_args()
+
+    results, failures = [], 0
+    for name in args.scenario or SCENARIOS:
+        result = run_scenario(name, args.scans, args.seed, args.deadline)
+        results.append(result)
+        wall = result['scan_seconds']
+        print(f"\n{name}: numverify {result['behavior']['numverify']} | hibp {result['behavior']['hibp']}")
+        print(f"scan: median {wall['median'] * 1e3:.1f}ms, p95 {wall['p95'] * 1e3:.1f}ms, max {wall['max'] * 1e3:.1f}ms")
+        print(f"{'stage':<22} {'median (ms)':>12} {'p95 (ms)':>10}  status")
+        for stage, entry in result['stages'].items():
+            status = ', '.join(f'{key}={count}' for key, count in sorted(entry['status'].items()))
+            print(f"{stage:<22} {entry['median'] * 1e3:>12.2f} {entry['p95'] * 1e3:>10.2f}  {status}")
+        print(f"stand-in responses: {result['server_requests']}")
+        if args.check:
+            for description, passed in check_scenario(result):
+                print(f"[{'+' if passed else '-'}] {description}")
+                failures += not passed
+    if args.check:
+        for description, passed in check_hung_provider(args.seed):
+            print(f"[{'+' if passed else '-'}] {description}")
+            failures += not passed
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"\n[+] Results written to {args.json}")
+    if failures:
+        print(f"\n[-] {failures} check(s) failed")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Startup benchmark for the OSINT reconnaissance CLIs
+Measures cold import time and peak RSS for --help, an offline-only scan and a full scan
+against the local Numverify/HIBP stand-ins, so no run depends on the network
+
+Usage:
+    python benchmarks/bench_startup.py [-n RUNS] [--json out.json]
+    python benchmarks/bench_startup.py --compare baseline.json [--tolerance 0.25]
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TARGET = '+919876543210'
+OFFLINE_STAGES = 'basic_info,social_media_search,email_patterns,public_databases,username_patterns,investigation_links'
+
+
+@contextlib.contextmanager
+def stand_in_options():
+    """Run the provider stand-ins and yield the CLI options pointing at them
+
+    They get a process of their own: a child forked from a parent holding the
+    stand-ins' phonenumbers metadata would report that memory as its peak RSS.
+    """
+    proc = subprocess.Popen([sys.executable, '-u', os.path.join(REPO, 'benchmarks', 'stand_in_providers.py')],
+                            stdout=subprocess.PIPE, text=True)
+    try:
+        for line in proc.stdout:
+            if line.startswith('[*] Use: '):
+                break
+        else:
+            print("[-] Stand-in providers did not start")
+            sys.exit(1)
+        yield line[len('[*] Use: '):].split()
+    finally:
+        proc.terminate()
+        proc.wait()
+
+
+def scenarios(workdir, stand_ins):
+    """Scenario name -> argv (run from the repo root); stand_ins are the options from stand_in_options()"""
+    common = ['--no-cache', '--quota-ledger', os.path.join(workdir, 'quota.sqlite3')]
+    return {
+        'import': [sys.executable, '-c', 'import osint_recon_enhanced'],
+        'help': [sys.executable, 'osint_recon_enhanced.py', '--help'],
+        'offline_scan': [sys.executable, 'osint_recon_enhanced.py', TARGET, '--only', OFFLINE_STAGES] + common,
+        'full_scan': [sys.executable, 'osint_recon_enhanced.py', TARGET, '-e', 'target@example.com',
+                      '--deadline', '5'] + stand_ins + common,
+    }
+
+
+def run_once(argv):
+    """Run argv once, answering the authorization prompt; return (seconds, peak RSS in MiB)
+
+    Exits if the run fails, as its timing would not be comparable.
+    """
+    start = time.perf_counter()
+    proc = subprocess.Popen(argv, cwd=REPO, stdin=subprocess.PIPE,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    proc.stdin.write(b'yes\n')
+    proc.stdin.close()
+    _, status, rusage = os.wait4(proc.pid, 0)
+    elapsed = time.perf_counter() - start
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    if proc.returncode != 0:
+        print(f"[-] {' '.join(argv[1:])} exited with status {proc.returncode}")
+        sys.exit(1)
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    divisor = 1024 * 1024 if sys.platform == 'darwin' else 1024
+    return elapsed, rusage.ru_maxrss / divisor
+
+
+def measure(runs):
+    results = {}
+    with tempfile.TemporaryDirectory() as workdir, stand_in_options() as stand_ins:
+        for name, argv in scenarios(workdir, stand_ins).items():
+            samples = [run_once(argv) for _ in range(runs)]
+            results[name] = {
+                'seconds': round(min(s for s, _ in samples), 4),
+                'peak_rss_mib': round(max(r for _, r in samples), 1),
+            }
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """Print regressions beyond tolerance; return True if any were found"""
+    regressed = False
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if not previous:
+            continue
+        for metric in ('seconds', 'peak_rss_mib'):
+            if current[metric] > previous[metric] * (1 + tolerance):
+                print(f"[-] {name} {metric} regressed: {previous[metric]} -> {current[metric]}")
+                regressed = True
+    return regressed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='CLI startup time and memory benchmark')
+    parser.add_argument('-n', '--runs', type=int, default=5, help='Runs per scenario (best time, worst RSS)')
+    parser.add_argument('--json', help='Write results to this file')
+    parser.add_argument('--compare', help='Baseline JSON from a previous --json run')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='Allowed relative regression')
+    args = parser.parse_args()
+
+    results = measure(args.runs)
+    print(f"{'scenario':<14} {'seconds':>9} {'peak RSS (MiB)':>15}")
+    for name, values in results.items():
+        print(f"{name:<14} {values['seconds']:>9.3f} {values['peak_rss_mib']:>15.1f}")
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"[+] Results saved to: {args.json}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if compare(results, baseline, args.tolerance):
+            sys.exit(1)
+        print("[+] No regressions beyond tolerance")
+
+
+if __name__ == "__main__":
+    main()
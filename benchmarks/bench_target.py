@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: phone number parse/format cost per scan
+Compares the old per-stage parsing with a single shared ParsedTarget
+
+Usage: python benchmarks/bench_target.py [-n ITERATIONS] [phone ...]
+"""
+
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import phonenumbers
+from osint_target import ParsedTarget
+
+DEFAULT_NUMBERS = ['+919876543210', '+14155552671', '+442079460958']
+
+
+def scan_before(phone_number):
+    """Parse/format work done by comprehensive_scan before ParsedTarget"""
+    # validate_phone_number
+    parsed = phonenumbers.parse(phone_number, None)
+    if phonenumbers.is_valid_number(parsed):
+        phonenumbers.format_number(parsed, phonenumbers.PhoneNumberFormat.E164)
+    # get_enhanced_phone_info
+    parsed = phonenumbers.parse(phone_number, None)
+    phonenumbers.is_valid_number(parsed)
+    phonenumbers.format_number(parsed, phonenumbers.PhoneNumberFormat.NATIONAL)
+    phonenumbers.format_number(parsed, phonenumbers.PhoneNumberFormat.INTERNATIONAL)
+    phonenumbers.format_number(parsed, phonenumbers.PhoneNumberFormat.E164)
+    # hand-rolled cleanup repeated across the URL/pattern stages
+    for _ in range(5):
+        clean_number = phone_number.replace('+', '').replace(' ', '')
+        clean_number[2:] if clean_number.startswith('91') else clean_number
+
+
+def scan_after(phone_number):
+    """Parse/format work done by comprehensive_scan with ParsedTarget"""
+    target = ParsedTarget.parse(phone_number)
+    for _ in range(5):
+        target.digits
+        target.national_number
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Parse/format cost per scan')
+    parser.add_argument('numbers', nargs='*', default=DEFAULT_NUMBERS)
+    parser.add_argument('-n', '--iterations', type=int, default=20000)
+    args = parser.parse_args()
+
+    # Warm phonenumbers metadata so both sides measure steady-state cost
+    for number in args.numbers:
+        scan_before(number)
+        scan_after(number)
+
+    print(f"{'number':<16} {'before (us)':>12} {'after (us)':>12} {'speedup':>8}")
+    for number in args.numbers:
+        before = min(timeit.repeat(lambda: scan_before(number), number=args.iterations, repeat=3))
+        after = min(timeit.repeat(lambda: scan_after(number), number=args.iterations, repeat=3))
+        before_us = before / args.iterations * 1e6
+        after_us = after / args.iterations * 1e6
+        print(f"{number:<16} {before_us:>12.2f} {after_us:>12.2f} {before_us / after_us:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
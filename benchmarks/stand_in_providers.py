@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+Local stand-ins for the Numverify and HIBP APIs
+Serves the apilayer `validate` and HIBP `breachedaccount` contracts on 127.0.0.1 with
+configurable latency, jitter, 503 error rate and 429 throttling, seeded for reproducible runs
+
+Usage: python benchmarks/stand_in_providers.py [--numverify SPEC] [--hibp SPEC] [--seed N]
+       SPEC is e.g. latency=0.05,jitter=0.02,errors=0.1,throttle=0.2,retry_after=1
+
+Prints the --endpoint options that point the CLIs (or `serve`) at the stand-ins.
+"""
+
+import argparse
+import http.server
+import json
+import os
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from urllib.parse import parse_qs, unquote, urlsplit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import phonenumbers
+from phonenumbers import carrier, geocoder
+
+STAND_IN_API_KEY = 'stand-in-key'
+
+# Accounts the HIBP stand-in reports as breached, besides any containing 'pwned'
+BREACHED_ACCOUNTS = {'breached@example.com'}
+BREACHES = [
+    {'Name': 'Adobe', 'Domain': 'adobe.com', 'BreachDate': '2013-10-04', 'PwnCount': 152445165},
+    {'Name': 'LinkedIn', 'Domain': 'linkedin.com', 'BreachDate': '2012-05-05', 'PwnCount': 164611595},
+]
+
+NUMVERIFY_LINE_TYPES = {
+    phonenumbers.PhoneNumberType.MOBILE: 'mobile',
+    phonenumbers.PhoneNumberType.FIXED_LINE: 'landline',
+    phonenumbers.PhoneNumberType.FIXED_LINE_OR_MOBILE: 'mobile',
+    phonenumbers.PhoneNumberType.TOLL_FREE: 'toll_free',
+    phonenumbers.PhoneNumberType.PREMIUM_RATE: 'premium_rate',
+    phonenumbers.PhoneNumberType.VOIP: 'special_services',
+}
+
+
+class Behavior:
+    """How a stand-in degrades: fixed latency plus uniform jitter, then 429s and 503s at the given rates"""
+
+    __slots__ = ('latency', 'jitter', 'errors', 'throttle', 'retry_after')
+
+    def __init__(self, latency=0.0, jitter=0.0, errors=0.0, throttle=0.0, retry_after=1.0):
+        self.latency = latency
+        self.jitter = jitter
+        self.errors = errors
+        self.throttle = throttle
+        self.retry_after = retry_after
+
+    @classmethod
+    def parse(cls, spec):
+        """Behavior from 'latency=0.05,errors=0.1,...'"""
+        values = {}
+        for item in (spec or '').split(','):
+            if not item.strip():
+                continue
+            name, _, value = item.partition('=')
+            if name.strip() not in cls.__slots__ or not value:
+                raise ValueError(f"Invalid behavior '{item}' (keys: {', '.join(cls.__slots__)})")
+            values[name.strip()] = float(value)
+        return cls(**values)
+
+    def __repr__(self):
+        return ','.join(f'{name}={getattr(self, name):g}' for name in self.__slots__)
+
+
+class StandInHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status, body=None, headers=()):
+        payload = json.dumps(body).encode('utf-8') if body is not None else b''
+        try:
+            self.send_response(status)
+            for name, value in headers:
+                self.send_header(name, value)
+            if body is not None:
+                self.send_header('Content-Type', 'application/json; charset=utf-8')
+            self.send_header('Content-Length', str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+        except (BrokenPipeError, ConnectionResetError):
+            # The client gave up (deadline or stage timeout); nothing was delivered, so nothing is counted
+            self.close_connection = True
+            return
+        self.server.record(status)
+
+    def do_GET(self):
+        outcome, delay = self.server.draw()
+        time.sleep(delay)
+        if outcome == 'throttle':
+            self._send(429, {'statusCode': 429, 'message': 'Rate limit is exceeded.'},
+                       [('Retry-After', f'{self.server.behavior.retry_after:g}')])
+        elif outcome == 'error':
+            self._send(503, {'statusCode': 503, 'message': 'Service unavailable'})
+        else:
+            self.server.respond(self, urlsplit(self.path))
+
+
+class StandInServer(http.server.ThreadingHTTPServer):
+    """One provider's stand-in; subclasses implement respond() for its contract"""
+
+    daemon_threads = True
+    provider = None
+    path = '/'
+
+    def __init__(self, behavior=None, seed=0, port=0):
+        super().__init__(('127.0.0.1', port), StandInHandler)
+        self.behavior = behavior or Behavior()
+        self.stats = Counter()
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def endpoint(self):
+        return f'http://127.0.0.1:{self.server_address[1]}{self.path}'
+
+    def draw(self):
+        """(outcome, delay) for the next request, from the seeded generator"""
+        with self._lock:
+            delay = self.behavior.latency + self._random.uniform(0, self.behavior.jitter)
+            roll = self._random.random()
+        if roll < self.behavior.throttle:
+            return 'throttle', delay
+        if roll < self.behavior.throttle + self.behavior.errors:
+            return 'error', delay
+        return 'ok', delay
+
+    def record(self, status):
+        with self._lock:
+            self.stats[status] += 1
+
+    def respond(self, handler, url):
+        raise NotImplementedError
+
+    def start(self):
+        self._thread = threading.Thread(target=self.serve_forever, name=f'stand-in-{self.provider}', daemon=True)
+        self._thread.start()
+        return self
+
+    def close(self):
+        self.shutdown()
+        self.server_close()
+
+
+class NumverifyStandIn(StandInServer):
+    """GET /api/validate?access_key=...&number=... as apilayer answers it"""
+
+    provider = 'numverify'
+    path = '/api/validate'
+
+    def __init__(self, behavior=None, seed=0, port=0):
+        super().__init__(behavior, seed, port)
+        # Load carrier/geocoder metadata now so the first request isn't slower than the rest
+        self.lookup('+14155552671')
+
+    def _error(self, code, kind, info):
+        return {'success': False, 'error': {'code': code, 'type': kind, 'info': info}}
+
+    def lookup(self, number):
+        try:
+            parsed = phonenumbers.parse(number if number.startswith('+') else '+' + number, None)
+        except phonenumbers.NumberParseException:
+            parsed = None
+        if parsed is None or not phonenumbers.is_valid_number(parsed):
+            return {'valid': False, 'number': number.lstrip('+'), 'local_format': '', 'international_format': '',
+                    'country_prefix': '', 'country_code': '', 'country_name': '', 'location': '', 'carrier': '',
+                    'line_type': None}
+        region = phonenumbers.region_code_for_number(parsed)
+        return {
+            'valid': True,
+            'number': f'{parsed.country_code}{parsed.national_number}',
+            'local_format': str(parsed.national_number),
+            'international_format': phonenumbers.format_number(parsed, phonenumbers.PhoneNumberFormat.E164),
+            'country_prefix': f'+{parsed.country_code}',
+            'country_code': region,
+            'country_name': geocoder.country_name_for_number(parsed, 'en'),
+            'location': geocoder.description_for_number(parsed, 'en'),
+            'carrier': carrier.name_for_number(parsed, 'en'),
+            'line_type': NUMVERIFY_LINE_TYPES.get(phonenumbers.number_type(parsed)),
+        }
+
+    def respond(self, handler, url):
+        if url.path != self.path:
+            return handler._send(404, self._error(103, 'invalid_api_function', 'This API Function does not exist.'))
+        query = parse_qs(url.query)
+        if query.get('access_key', [''])[0] != STAND_IN_API_KEY:
+            # apilayer reports plan and key problems as 200 with success=false
+            return handler._send(200, self._error(101, 'invalid_access_key',
+                                                  'You have not supplied a valid API Access Key.'))
+        number = query.get('number', [''])[0]
+        if not number:
+            return handler._send(200, self._error(210, 'no_phone_number_provided',
+                                                  'Please specify a phone number.'))
+        handler._send(200, self.lookup(number))
+
+
+class HIBPStandIn(StandInServer):
+    """GET /api/v3/breachedaccount/{account} as HIBP answers it"""
+
+    provider = 'hibp'
+    path = '/api/v3/breachedaccount/'
+
+    def __init__(self, behavior=None, seed=0, port=0, require_api_key=False):
+        super().__init__(behavior, seed, port)
+        # The live API wants an hibp-api-key header; off by default because the stage sends none
+        self.require_api_key = require_api_key
+
+    def respond(self, handler, url):
+        if not url.path.startswith(self.path) or len(url.path) == len(self.path):
+            return handler._send(404)
+        if self.require_api_key and not handler.headers.get('hibp-api-key'):
+            return handler._send(401, {'statusCode': 401, 'message': 'Access denied due to missing hibp-api-key.'})
+        account = unquote(url.path[len(self.path):]).lower()
+        if account not in BREACHED_ACCOUNTS and 'pwned' not in account:
+            # No breach: 404 with an empty body
+            return handler._send(404)
+        if parse_qs(url.query).get('truncateResponse', ['true'])[0].lower() == 'false':
+            return handler._send(200, BREACHES)
+        handler._send(200, [{'Name': breach['Name']} for breach in BREACHES])
+
+
+class StandIns:
+    """Both stand-ins, started on free ports"""
+
+    def __init__(self, numverify=None, hibp=None, seed=0):
+        # Separate seeds so one provider's traffic doesn't shift the other's draws
+        self.servers = {
+            'numverify': NumverifyStandIn(numverify, seed).start(),
+            'hibp': HIBPStandIn(hibp, seed + 1).start(),
+        }
+
+    @property
+    def endpoints(self):
+        """ReconEngine(endpoints=...) / --endpoint values"""
+        return {provider: server.endpoint for provider, server in self.servers.items()}
+
+    def stats(self):
+        return {provider: dict(sorted(server.stats.items())) for provider, server in self.servers.items()}
+
+    def close(self):
+        for server in self.servers.values():
+            server.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Serve local Numverify and HIBP stand-ins')
+    parser.add_argument('--numverify', default='', metavar='SPEC', help='Numverify behavior, e.g. latency=0.05,errors=0.1')
+    parser.add_argument('--hibp', default='', metavar='SPEC', help='HIBP behavior, e.g. latency=0.1,throttle=0.2,retry_after=2')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed for jitter and failures (default: %(default)s)')
+    args = parser.parse_args()
+    try:
+        numverify, hibp = Behavior.parse(args.numverify), Behavior.parse(args.hibp)
+    except ValueError as e:
+        parser.error(str(e))
+
+    with StandIns(numverify, hibp, args.seed) as stand_ins:
+        print(f"[+] numverify ({numverify!r}) and hibp ({hibp!r}) stand-ins running")
+        print(f"[*] Use: --api-key {STAND_IN_API_KEY} "
+              + ' '.join(f'--endpoint {provider}={url}' for provider, url in stand_ins.endpoints.items()))
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            print(f"\n[*] Requests served: {stand_ins.stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Library API for the OSINT reconnaissance tools
+Purpose: Run authorized scans from other programs, synchronously or from asyncio, without prompts or prints
+
+    from osint_api import ReconClient
+
+    with ReconClient(api_key=KEY) as client:
+        result = client.scan('+919876543210', authorization='engagement.json')
+
+    async with ReconClient() as client:
+        results = await asyncio.gather(*(client.ascan(n, authorization=token) for n in numbers))
+
+Every scan must carry an authorization (osint_auth.Authorization, an engagement
+file path or a signed token) that covers the target. One client shares its
+engine, HTTP connection pools, rate limits and quota accounting across all
+jobs; progress goes to a callback or the 'osint_recon' logger.
+"""
+
+import asyncio
+import concurrent.futures
+import inspect
+
+from osint_auth import Authorization, AuthorizationError
+from osint_engine import ReconEngine, STAGE_REGISTRY, log_progress
+from osint_recon_enhanced import EnhancedOSINTRecon
+
+__all__ = ['ReconClient', 'AuthorizationError', 'scan', 'ascan']
+
+# scan()/ascan() keywords that belong to the scan rather than the throwaway client
+SCAN_OPTIONS = ('deadline', 'only', 'skip', 'progress', 'report', 'profiler', 'workspace')
+
+
+class ReconClient:
+    """Shared engine and connection pool for many authorized scans"""
+
+    def __init__(self, api_key=None, cache=None, limiter=None, prefix_index=None, stage_timeout=15.0,
+                 progress=None, engine_class=EnhancedOSINTRecon, max_concurrent_scans=8, endpoints=None):
+        if not issubclass(engine_class, ReconEngine):
+            raise TypeError('engine_class must be a ReconEngine subclass')
+        self.engine = engine_class(api_key=api_key, stage_timeout=stage_timeout, cache=cache, limiter=limiter,
+                                   prefix_index=prefix_index, progress=progress or log_progress,
+                                   endpoints=endpoints)
+        # Scans block on the network from worker threads; ascan() hands them to this pool
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_concurrent_scans,
+                                                               thread_name_prefix='osint-scan')
+
+    @property
+    def stages(self):
+        """Names of every registered stage, for only=/skip="""
+        return list(STAGE_REGISTRY)
+
+    def scan(self, phone_number, email=None, *, authorization, deadline=None, only=None, skip=None,
+             progress=None, report=None, profiler=None, workspace=None):
+        """Run one scan and return its ScanResult
+
+        Raises AuthorizationError if the authorization is missing, expired or
+        does not cover the phone number (and email, if given). Pass an
+        osint_profile.ScanProfiler as profiler to fill in ScanResult.timings, and an
+        osint_workspace.Workspace as workspace to reuse fresh stage results and store the run.
+        """
+        authorization = Authorization.coerce(authorization)
+        return self.engine.comprehensive_scan(phone_number, email, deadline=deadline, only=only, skip=skip,
+                                              report=report, progress=progress, authorization=authorization,
+                                              profiler=profiler, workspace=workspace)
+
+    async def ascan(self, phone_number, email=None, *, authorization, deadline=None, only=None, skip=None,
+                    progress=None, report=None, profiler=None, workspace=None):
+        """scan() for asyncio: runs in the client's worker pool, delivering progress on the event loop"""
+        authorization = Authorization.coerce(authorization)
+        loop = asyncio.get_running_loop()
+        if progress is not None:
+            progress = self._loop_progress(loop, progress)
+        return await loop.run_in_executor(
+            self._executor,
+            lambda: self.scan(phone_number, email, authorization=authorization, deadline=deadline, only=only,
+                              skip=skip, progress=progress, report=report, profiler=profiler,
+                              workspace=workspace)
+        )
+
+    @staticmethod
+    def _loop_progress(loop, progress):
+        """Wrap a progress callback (plain or async) so it runs on the event loop thread"""
+        if inspect.iscoroutinefunction(progress):
+            return lambda event, data: asyncio.run_coroutine_threadsafe(progress(event, data), loop)
+        return lambda event, data: loop.call_soon_threadsafe(progress, event, data)
+
+    def close(self):
+        """Release what the client built: its worker pool and HTTP session
+
+        A cache or limiter passed in (and the limiter's quota ledger) belongs
+        to the caller and stays open; the client never builds either itself.
+        """
+        self._executor.shutdown(wait=True)
+        if self.engine._session is not None:
+            self.engine._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
+
+
+def scan(phone_number, email=None, *, authorization, **options):
+    """One-off scan with a throwaway client; options are ReconClient and scan() keywords"""
+    scan_options = {key: options.pop(key) for key in SCAN_OPTIONS if key in options}
+    with ReconClient(**options) as client:
+        return client.scan(phone_number, email, authorization=authorization, **scan_options)
+
+
+async def ascan(phone_number, email=None, *, authorization, **options):
+    """Async one-off scan with a throwaway client"""
+    scan_options = {key: options.pop(key) for key in SCAN_OPTIONS if key in options}
+    async with ReconClient(**options) as client:
+        return await client.ascan(phone_number, email, authorization=authorization, **scan_options)
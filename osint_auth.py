@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Engagement authorization for the OSINT reconnaissance tools
+Purpose: Satisfy the authorization gate from an engagement file or signed token instead of stdin
+
+An engagement file is JSON:
+
+    {
+        "engagement": "ACME-2026-014",
+        "authorized_by": "J. Doe, CISO, ACME Ltd",
+        "expires": "2026-12-31",
+        "scope": {"phones": ["+91", "+14155552671"], "emails": ["@acme.example", "bob@example.com"]}
+    }
+
+Phone scope entries are E.164 prefixes; email entries are full addresses or
+'@domain'. An omitted scope list means that identifier type is out of scope.
+A token carries the same claims, signed with HMAC-SHA256 using a secret shared
+with the issuing service (OSINT_RECON_AUTH_SECRET by default).
+"""
+
+import base64
+import hashlib
+import hmac
+import json
+import os
+import time
+
+TOKEN_VERSION = 'v1'
+TOKEN_SECRET_ENV = 'OSINT_RECON_AUTH_SECRET'
+
+
+class AuthorizationError(PermissionError):
+    """Raised when a scan is not covered by a valid authorization"""
+
+
+def _b64encode(data):
+    return base64.urlsafe_b64encode(data).rstrip(b'=').decode('ascii')
+
+
+def _b64decode(text):
+    return base64.urlsafe_b64decode(text + '=' * (-len(text) % 4))
+
+
+def _sign(payload, secret):
+    return hmac.new(secret.encode('utf-8'), payload.encode('ascii'), hashlib.sha256).hexdigest()
+
+
+def _token_secret(secret):
+    secret = secret or os.environ.get(TOKEN_SECRET_ENV)
+    if not secret:
+        raise AuthorizationError(f'No token secret given and {TOKEN_SECRET_ENV} is not set')
+    return secret
+
+
+def issue_token(claims, secret=None):
+    """Sign engagement claims into a token (for the service that grants authorizations)"""
+    payload = _b64encode(json.dumps(claims, sort_keys=True, separators=(',', ':')).encode('utf-8'))
+    return f'{TOKEN_VERSION}.{payload}.{_sign(payload, _token_secret(secret))}'
+
+
+class Authorization:
+    """A signed-off engagement: who authorized it, until when, and which identifiers it covers"""
+
+    __slots__ = ('engagement', 'authorized_by', 'expires', 'phones', 'emails')
+
+    def __init__(self, engagement, authorized_by, expires=None, phones=(), emails=()):
+        if not engagement or not authorized_by:
+            raise AuthorizationError('Authorization must name the engagement and who authorized it')
+        self.engagement = engagement
+        self.authorized_by = authorized_by
+        # Last day (UTC, YYYY-MM-DD) the authorization is valid, inclusive
+        self.expires = expires
+        self.phones = tuple(phones)
+        self.emails = tuple(email.lower() for email in emails)
+
+    @classmethod
+    def from_claims(cls, claims):
+        scope = claims.get('scope') or {}
+        return cls(claims.get('engagement'), claims.get('authorized_by'), claims.get('expires'),
+                   scope.get('phones', ()), scope.get('emails', ()))
+
+    @classmethod
+    def from_file(cls, path):
+        try:
+            with open(path, encoding='utf-8') as f:
+                claims = json.load(f)
+        except (OSError, ValueError) as e:
+            raise AuthorizationError(f'Cannot read authorization file {path}: {e}')
+        return cls.from_claims(claims)
+
+    @classmethod
+    def from_token(cls, token, secret=None):
+        """Verify a token from issue_token and return its Authorization"""
+        version, _, rest = token.partition('.')
+        payload, _, signature = rest.partition('.')
+        if version != TOKEN_VERSION or not payload or not signature:
+            raise AuthorizationError('Malformed authorization token')
+        if not hmac.compare_digest(signature, _sign(payload, _token_secret(secret))):
+            raise AuthorizationError('Authorization token signature does not match')
+        try:
+            claims = json.loads(_b64decode(payload))
+        except ValueError:
+            raise AuthorizationError('Malformed authorization token')
+        return cls.from_claims(claims)
+
+    @classmethod
+    def coerce(cls, value):
+        """Accept an Authorization, a token string or a path to an engagement file"""
+        if isinstance(value, cls):
+            return value
+        if not value:
+            raise AuthorizationError('An authorization file or token is required')
+        if isinstance(value, str) and value.startswith(TOKEN_VERSION + '.') and not os.path.exists(value):
+            return cls.from_token(value)
+        return cls.from_file(value)
+
+    def expired(self, now=None):
+        return self.expires is not None and time.strftime('%Y-%m-%d', time.gmtime(now)) > self.expires
+
+    def covers_phone(self, e164):
+        return any(e164.startswith(prefix) for prefix in self.phones)
+
+    def covers_email(self, email):
+        email = email.lower()
+        return any(email == entry or (entry.startswith('@') and email.endswith(entry)) for entry in self.emails)
+
+    def check(self, e164, email=None):
+        """Raise AuthorizationError unless this authorization covers the target"""
+        if self.expired():
+            raise AuthorizationError(f'Authorization for {self.engagement} expired on {self.expires}')
+        if not self.covers_phone(e164):
+            raise AuthorizationError(f'{e164} is outside the scope of engagement {self.engagement}')
+        if email and not self.covers_email(email):
+            raise AuthorizationError(f'{email} is outside the scope of engagement {self.engagement}')
+
+    def __repr__(self):
+        return f"Authorization({self.engagement!r}, authorized_by={self.authorized_by!r}, expires={self.expires!r})"
+
+
+def authorization_from_args(args):
+    """Authorization from --authorization/--auth-token, or None to fall back to the interactive prompt"""
+    if args.auth_token:
+        return Authorization.from_token(args.auth_token)
+    if args.authorization:
+        return Authorization.from_file(args.authorization)
+    return None
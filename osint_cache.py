@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Persistent TTL response cache for the OSINT reconnaissance tools
+Purpose: Avoid re-querying Numverify/HIBP for identifiers looked up recently
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'osint_recon', 'responses.sqlite3')
+
+# Seconds a cached response stays fresh, per provider
+DEFAULT_TTLS = {
+    'numverify': 7 * 24 * 3600,
+    'hibp': 24 * 3600,
+}
+
+# Only definitive answers are worth caching (HIBP answers 404 for "no breaches")
+CACHEABLE_STATUSES = (200, 404)
+
+# Query parameters that carry credentials and must never reach the cache key
+SECRET_PARAMS = frozenset(('access_key', 'api_key', 'apikey', 'key', 'token'))
+
+
+def cache_key(method, url, params=None):
+    """Build a cache key from the request, with credentials stripped"""
+    parts = urlsplit(url)
+    query = parse_qsl(parts.query, keep_blank_values=True)
+    if params:
+        query.extend(params.items() if isinstance(params, dict) else params)
+    query = sorted((k, v) for k, v in query if k.lower() not in SECRET_PARAMS)
+    return f"{method.upper()} {urlunsplit((parts.scheme, parts.netloc.lower(), parts.path, urlencode(query), ''))}"
+
+
+def parse_ttl_overrides(values):
+    """Parse repeated PROVIDER=SECONDS options into a TTL dict, raising ValueError for bad ones"""
+    ttls = {}
+    for value in values or ():
+        provider, _, seconds = value.partition('=')
+        provider = provider.strip()
+        if not seconds:
+            raise ValueError(f"Invalid TTL override '{value}', expected PROVIDER=SECONDS")
+        if provider not in DEFAULT_TTLS:
+            raise ValueError(f"Unknown provider '{provider}' in '{value}' (cached providers: {', '.join(DEFAULT_TTLS)})")
+        try:
+            ttl = float(seconds)
+        except ValueError:
+            raise ValueError(f"Invalid TTL '{seconds}' in '{value}', expected a number of seconds") from None
+        if not ttl >= 0:
+            raise ValueError(f"Invalid TTL '{seconds}' in '{value}', must be zero or more seconds")
+        ttls[provider] = ttl
+    return ttls
+
+
+def describe_stats(stats):
+    """One-line summary of a scan's cache statistics for reports"""
+    if stats.get('disabled'):
+        return 'disabled'
+    return f"{stats['hits']} hits, {stats['misses']} misses"
+
+
+def cache_from_args(args):
+    """Build the response cache selected by the CLI options, or None if disabled"""
+    if args.no_cache:
+        return None
+    return ResponseCache(args.cache_path, ttls=parse_ttl_overrides(args.cache_ttl), refresh=args.refresh)
+
+
+class ResponseCache:
+    """SQLite-backed response cache with per-provider TTLs and LRU eviction"""
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, ttls=None, max_entries=5000, refresh=False):
+        self.path = path
+        self.ttls = dict(DEFAULT_TTLS)
+        if ttls:
+            self.ttls.update(ttls)
+        self.max_entries = max_entries
+        self.refresh = refresh
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        if path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                provider TEXT NOT NULL,
+                status INTEGER NOT NULL,
+                headers TEXT NOT NULL,
+                body BLOB NOT NULL,
+                stored_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+        """)
+        self._db.execute("CREATE INDEX IF NOT EXISTS responses_lru ON responses (accessed_at)")
+        self._db.commit()
+
+    def handles(self, provider):
+        """Whether responses from this provider are cached at all"""
+        return bool(self.ttls.get(provider))
+
+    def get(self, provider, key):
+        """Return a fresh cached Response or None"""
+        now = time.time()
+        with self._lock:
+            if self.refresh:
+                self.misses += 1
+                return None
+            row = self._db.execute(
+                "SELECT status, headers, body, stored_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or now - row[3] > self.ttls[provider]:
+                if row is not None:
+                    self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    self._db.commit()
+                self.misses += 1
+                return None
+            self._db.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+            self._db.commit()
+            self.hits += 1
+
+        import requests
+        from requests.structures import CaseInsensitiveDict
+
+        response = requests.Response()
+        response.status_code = row[0]
+        response.headers = CaseInsensitiveDict(json.loads(row[1]))
+        response._content = row[2]
+        response.url = key.split(' ', 1)[1]
+        response.from_cache = True
+        return response
+
+    def store(self, provider, key, response):
+        """Store a response if it is cacheable, evicting least recently used entries"""
+        if response.status_code not in CACHEABLE_STATUSES:
+            return
+        # Numverify reports bad keys / quota errors as 200 with success=false
+        try:
+            data = response.json()
+        except ValueError:
+            data = None
+        if isinstance(data, dict) and data.get('success') is False:
+            return
+        now = time.time()
+        headers = {k: v for k, v in response.headers.items() if k.lower() == 'content-type'}
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, provider, response.status_code, json.dumps(headers), response.content, now, now)
+            )
+            self._db.execute(
+                "DELETE FROM responses WHERE key IN ("
+                "SELECT key FROM responses ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,)
+            )
+            self._db.commit()
+
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses}
+
+    def stats_since(self, before):
+        """Hit/miss counts accumulated since an earlier stats() snapshot"""
+        return {name: count - before[name] for name, count in self.stats().items()}
+
+    def close(self):
+        with self._lock:
+            self._db.close()
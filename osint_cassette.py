@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Record/replay cassettes for the OSINT reconnaissance tools
+Purpose: Capture provider responses once, then re-run scans and reports from them with no network I/O
+
+    python osint_recon_enhanced.py +919876543210 --api-key KEY --record scan.cassette.json
+    python osint_recon_enhanced.py +919876543210 --replay scan.cassette.json --format html -o report.html
+
+A cassette is JSON holding every provider attempt of the recorded scans
+(retries and transport errors included) in order. API keys never reach it:
+credential query parameters are dropped and only Content-Type/Retry-After
+response headers are kept. The phone number and email of each request are
+replaced by placeholders in URLs and bodies, and filled back in from the
+replaying scan's own request. Replayed scans bypass the response cache,
+rate limits and quotas.
+"""
+
+import json
+import os
+import threading
+import time
+from urllib.parse import parse_qsl, unquote, urlsplit
+
+from osint_cache import SECRET_PARAMS
+
+CASSETTE_VERSION = 1
+
+# Response headers worth replaying; everything else (cookies, request ids) is dropped
+KEPT_HEADERS = ('content-type', 'retry-after')
+
+# Query parameters carrying the phone number, and the path segment carrying the HIBP account
+PHONE_PARAMS = ('number',)
+EMAIL_PATH_MARKER = '/breachedaccount/'
+
+
+class CassetteError(Exception):
+    """Raised for unreadable cassettes"""
+
+
+class CassetteMiss(Exception):
+    """Raised when replaying a request the cassette has no recording for"""
+
+
+def _phone_identifiers(value):
+    """Placeholder -> value for every form of a phone number that shows up in requests and responses"""
+    import phonenumbers
+
+    try:
+        parsed = phonenumbers.parse(value if value.startswith('+') else '+' + value, None)
+    except phonenumbers.NumberParseException:
+        return {'<phone>': value}
+    e164 = phonenumbers.format_number(parsed, phonenumbers.PhoneNumberFormat.E164)
+    return {
+        '<phone:e164>': e164,
+        '<phone:digits>': e164[1:],
+        '<phone:national>': str(parsed.national_number),
+    }
+
+
+def request_identifiers(url, params=None):
+    """(path, query, identifiers) for a request: secrets dropped, identifiers keyed by placeholder"""
+    parts = urlsplit(url)
+    query = parse_qsl(parts.query, keep_blank_values=True)
+    if params:
+        query.extend(params.items() if isinstance(params, dict) else params)
+    query = sorted((k, str(v)) for k, v in query if v is not None and k.lower() not in SECRET_PARAMS)
+    path = unquote(parts.path)
+    identifiers = {}
+    for name, value in query:
+        if name in PHONE_PARAMS and value:
+            identifiers.update(_phone_identifiers(value))
+    if EMAIL_PATH_MARKER in path:
+        account = path.split(EMAIL_PATH_MARKER, 1)[1]
+        if account:
+            identifiers['<email>'] = account
+    return path, query, identifiers
+
+
+def redact(text, identifiers):
+    # Longest first, so the E.164 form is replaced before the digits it contains
+    for placeholder, value in sorted(identifiers.items(), key=lambda item: -len(item[1])):
+        if value:
+            text = text.replace(value, placeholder)
+    return text
+
+
+def restore(text, identifiers):
+    for placeholder, value in identifiers.items():
+        text = text.replace(placeholder, value)
+    return text
+
+
+def interaction_key(provider, method, url, params=None):
+    """Redacted request identity; host is left out so a cassette also replays against moved endpoints"""
+    path, query, identifiers = request_identifiers(url, params)
+    text = f"{provider} {method.upper()} {path}"
+    if query:
+        text += '?' + '&'.join(f'{k}={v}' for k, v in query)
+    return redact(text, identifiers), identifiers
+
+
+class Cassette:
+    """Provider attempts recorded in order, keyed by redacted request; replayed per key in the same order"""
+
+    def __init__(self, path, mode='record', interactions=None, recorded_at=None):
+        if mode not in ('record', 'replay'):
+            raise ValueError(f"Unknown cassette mode '{mode}'")
+        self.path = path
+        self.mode = mode
+        self.interactions = list(interactions or ())
+        self.recorded_at = recorded_at
+        self._positions = {}
+        self._lock = threading.Lock()
+
+    @property
+    def replaying(self):
+        return self.mode == 'replay'
+
+    @classmethod
+    def load(cls, path):
+        """Open a recorded cassette for replay"""
+        try:
+            with open(path, encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            raise CassetteError(f'Cannot read cassette {path}: {e}')
+        if data.get('version') != CASSETTE_VERSION:
+            raise CassetteError(f"Cassette {path} has unsupported version {data.get('version')!r}")
+        return cls(path, 'replay', data.get('interactions', ()), data.get('recorded_at'))
+
+    def record(self, provider, method, url, params=None, response=None, error=None, elapsed=0.0):
+        """Append one attempt: its response, or the transport error it raised"""
+        key, identifiers = interaction_key(provider, method, url, params)
+        entry = {'key': key, 'elapsed': round(elapsed, 4)}
+        if error is not None:
+            entry['error'] = type(error).__name__
+        else:
+            entry['status'] = response.status_code
+            entry['reason'] = response.reason
+            entry['headers'] = {k: v for k, v in response.headers.items() if k.lower() in KEPT_HEADERS}
+            entry['body'] = redact(response.content.decode('utf-8', errors='replace'), identifiers)
+        with self._lock:
+            self.interactions.append(entry)
+
+    def play(self, provider, method, url, params=None):
+        """Recorded Response for the request, raising its recorded transport error if it had one
+
+        Repeated requests get the recorded attempts in order; once those run
+        out, the last one is served again.
+        """
+        import requests
+        from requests.structures import CaseInsensitiveDict
+
+        key, identifiers = interaction_key(provider, method, url, params)
+        with self._lock:
+            matches = [entry for entry in self.interactions if entry['key'] == key]
+            if not matches:
+                raise CassetteMiss(f'No recorded response for {key}')
+            position = self._positions.get(key, 0)
+            self._positions[key] = position + 1
+        entry = matches[min(position, len(matches) - 1)]
+        if 'error' in entry:
+            error_class = requests.Timeout if 'Timeout' in entry['error'] else requests.ConnectionError
+            raise error_class(f"{entry['error']} (replayed from {os.path.basename(self.path)})")
+        response = requests.Response()
+        response.status_code = entry['status']
+        response.reason = entry.get('reason')
+        response.headers = CaseInsensitiveDict(entry.get('headers', {}))
+        response._content = restore(entry.get('body', ''), identifiers).encode('utf-8')
+        response._content_consumed = True  # no connection behind it for close() to release
+        response.encoding = 'utf-8'
+        response.url = url
+        response.from_cassette = True
+        return response
+
+    def save(self):
+        """Write recorded interactions (no-op when replaying)"""
+        if self.replaying:
+            return
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        with self._lock:
+            data = {
+                'version': CASSETTE_VERSION,
+                'recorded_at': self.recorded_at or time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+                'interactions': list(self.interactions),
+            }
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+            f.write('\n')
+
+
+def cassette_from_args(args):
+    """Cassette for --record/--replay, or None"""
+    if getattr(args, 'replay', None):
+        return Cassette.load(args.replay)
+    if getattr(args, 'record', None):
+        return Cassette(args.record, 'record')
+    return None
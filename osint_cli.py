@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Command line shared by the OSINT reconnaissance tools
+Purpose: One set of options, checks and scan flow behind osint_recon.py and osint_recon_enhanced.py
+
+Each script passes its engine class (which is also its report layout), the
+profile name the daemon knows it by and its banner to run(). The serve and
+normalize subcommands are dispatched from here as well.
+"""
+
+import argparse
+import contextlib
+import sys
+
+from osint_engine import STAGE_REGISTRY, endpoints_from_args, parse_stage_list, print_progress, select_stages
+from osint_auth import AuthorizationError, authorization_from_args
+from osint_cassette import CassetteError, cassette_from_args
+from osint_cache import DEFAULT_CACHE_PATH, cache_from_args, parse_ttl_overrides
+from osint_ratelimit import DEFAULT_LEDGER_PATH, limiter_from_args, limits_from_args
+from osint_daemon import DEFAULT_SOCKET_PATH
+from osint_metrics import write_textfile_at_exit
+from osint_profile import ScanProfiler
+from osint_workspace import describe_diff, diff_scans, workspace_from_args
+from osint_report import REPORT_FORMATS, report_writer
+
+
+def add_provider_arguments(parser):
+    """Cache, rate limit, quota and endpoint options shared by the scan CLIs and `serve`"""
+    parser.add_argument('--no-cache', action='store_true', help='Do not read or write the provider response cache')
+    parser.add_argument('--cache-path', default=DEFAULT_CACHE_PATH, help='Response cache database (default: %(default)s)')
+    parser.add_argument('--cache-ttl', action='append', metavar='PROVIDER=SECONDS', help='Override cache TTL for a provider (numverify, hibp)')
+    parser.add_argument('--rate-limit', action='append', metavar='PROVIDER=PER_MINUTE', help='Override request rate for a provider (numverify, hibp)')
+    parser.add_argument('--quota', action='append', metavar='PROVIDER=CALLS', help='Override calls allowed per billing window for a provider')
+    parser.add_argument('--quota-ledger', default=DEFAULT_LEDGER_PATH, help='Persisted quota ledger (default: %(default)s)')
+    parser.add_argument('--endpoint', action='append', metavar='PROVIDER=URL', help='Send a provider\'s calls to another URL, e.g. a local stand-in (numverify, hibp)')
+
+
+def provider_options_from_args(args):
+    """Check the add_provider_arguments() options, returning the endpoint overrides; raises ValueError"""
+    endpoints = endpoints_from_args(args)
+    parse_ttl_overrides(args.cache_ttl)
+    limits_from_args(args)
+    return endpoints
+
+
+def build_parser(description):
+    """Argument parser for a scan"""
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument('phone', help='Phone number to investigate')
+    parser.add_argument('-e', '--email', help='Associated email address (optional)')
+    parser.add_argument('-o', '--output', help='Output file for the report')
+    parser.add_argument('--authorization', metavar='FILE', help='Engagement authorization file; replaces the interactive prompt')
+    parser.add_argument('--auth-token', metavar='TOKEN', help='Signed engagement token (secret in $OSINT_RECON_AUTH_SECRET); replaces the interactive prompt')
+    parser.add_argument('--daemon', action='store_true', help="Run the scan on the warm daemon started with 'serve' (needs --authorization or --auth-token)")
+    parser.add_argument('--socket', default=DEFAULT_SOCKET_PATH, help='Daemon socket for --daemon (default: %(default)s)')
+    parser.add_argument('--format', choices=REPORT_FORMATS, default='text', help='Report format (default: %(default)s)')
+    parser.add_argument('--api-key', help='Numverify API key for enhanced lookup')
+    parser.add_argument('--refresh', action='store_true', help='Ignore cached responses and workspace results but store fresh ones')
+    add_provider_arguments(parser)
+    parser.add_argument('--deadline', type=float, help='Whole-scan time budget in seconds; unfinished stages are reported as timed out')
+    parser.add_argument('--prefix-regions', metavar='REGIONS', help='Comma-separated regions (e.g. IN,US) served from a compact precompiled carrier/geocoder/timezone index')
+    parser.add_argument('--only', help=f"Comma-separated stages to run (available: {', '.join(STAGE_REGISTRY)})")
+    parser.add_argument('--skip', help='Comma-separated stages to leave out')
+    parser.add_argument('--profile', action='store_true', help='Add wall/CPU time per stage and DNS/connect/TLS/first-byte time per HTTP call to the report')
+    parser.add_argument('--pstats', metavar='FILE', help='Also dump merged cProfile statistics for the stages to FILE (implies --profile)')
+    parser.add_argument('--record', metavar='CASSETTE', help='Save every provider response of this scan to a cassette file (keys and identifiers redacted)')
+    parser.add_argument('--replay', metavar='CASSETTE', help='Answer provider calls from a cassette made with --record: no network I/O, no quota spent')
+    parser.add_argument('--workspace', metavar='FILE', help='Engagement workspace (SQLite): store this scan, reuse stages still fresh from earlier runs and show what changed')
+    parser.add_argument('--stale-after', action='append', metavar='STAGE=SECONDS', help='Override how long a stage\'s (or provider\'s) stored result is reused from the workspace')
+    parser.add_argument('--metrics-textfile', metavar='FILE', help='Write Prometheus metrics to FILE at exit (node_exporter textfile collector)')
+    return parser
+
+
+def run(engine_class, profile, banner, description, argv=None):
+    """Entry point of both CLIs: run one scan with engine_class, or the serve/normalize subcommand
+
+    profile is the daemon's name for engine_class ('basic' or 'enhanced'),
+    used by --daemon.
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    if argv[:1] == ['serve']:
+        # Long-running daemon; see osint_daemon.py
+        from osint_daemon import serve_main
+        return serve_main(argv[1:])
+    if argv[:1] == ['normalize']:
+        # Offline bulk validation of a phone inventory; see osint_normalize.py
+        from osint_normalize import normalize_main
+        return normalize_main(argv[1:])
+
+    parser = build_parser(description)
+    args = parser.parse_args(argv)
+    only, skip = parse_stage_list(args.only), parse_stage_list(args.skip)
+    if args.daemon:
+        if not (args.authorization or args.auth_token):
+            parser.error('--daemon needs --authorization or --auth-token; the daemon checks it for every job')
+        if args.metrics_textfile:
+            parser.error("--metrics-textfile covers this process only; give it to 'serve' instead of --daemon")
+        if args.record or args.replay:
+            parser.error('--record/--replay run in this process and cannot be combined with --daemon')
+        if args.workspace:
+            parser.error('--workspace runs in this process and cannot be combined with --daemon')
+        # Verified by the daemon, which holds the token secret
+        authorization = None
+    else:
+        try:
+            authorization = authorization_from_args(args)
+        except AuthorizationError as e:
+            parser.error(str(e))
+    try:
+        select_stages(engine_class.profile, only, skip)
+        endpoints = provider_options_from_args(args)
+        workspace = workspace_from_args(args)
+    except ValueError as e:
+        parser.error(str(e))
+    if args.record and args.replay:
+        parser.error('--record and --replay are mutually exclusive')
+    try:
+        cassette = cassette_from_args(args)
+    except CassetteError as e:
+        parser.error(str(e))
+
+    # Machine-readable reports on stdout get stdout to themselves; everything else goes to stderr
+    report_stream = sys.stdout
+    chatter = sys.stderr if args.format != 'text' and not args.output else sys.stdout
+    with contextlib.redirect_stdout(chatter):
+        print(banner)
+
+        if args.metrics_textfile:
+            write_textfile_at_exit(args.metrics_textfile)
+
+        if args.daemon:
+            from osint_daemon import client_main
+            return client_main(args, profile, engine_class(), report_stream, only, skip)
+
+        if authorization is not None:
+            print(f"[+] Authorized under engagement {authorization.engagement} ({authorization.authorized_by})")
+        else:
+            confirm = input("Do you have proper authorization to proceed? (yes/no): ")
+            if confirm.lower() != 'yes':
+                print("Exiting. Only use with proper authorization.")
+                sys.exit(1)
+
+        prefix_index = None
+        if args.prefix_regions:
+            # Built from the phonenumbers metadata on first use, then loaded from ~/.cache/osint_recon
+            from osint_prefix_index import PrefixIndex
+            prefix_index = PrefixIndex.load_or_build(args.prefix_regions)
+
+        recon = engine_class(api_key=args.api_key, cache=cache_from_args(args) if cassette is None else None,
+                             limiter=limiter_from_args(args),
+                             prefix_index=prefix_index, progress=print_progress, endpoints=endpoints,
+                             cassette=cassette)
+
+        profiler = ScanProfiler(args.pstats) if args.profile or args.pstats else None
+
+        target = recon.parse_target(args.phone)
+        if not target:
+            print(f"[-] Invalid phone number: {args.phone}")
+            sys.exit(1)
+        if authorization is not None:
+            try:
+                authorization.check(target.e164, args.email)
+            except AuthorizationError as e:
+                print(f"[-] {e}")
+                sys.exit(1)
+
+        print(f"[+] Validated phone number: {target.e164}")
+
+        # Perform comprehensive scan, writing each report section as its stage finishes
+        with (open(args.output, 'w') if args.output else contextlib.nullcontext(report_stream)) as stream:
+            scan = recon.comprehensive_scan(target, args.email, deadline=args.deadline, only=only, skip=skip,
+                                            report=report_writer(args.format, stream, recon),
+                                            authorization=authorization, profiler=profiler, workspace=workspace)
+        if args.output:
+            print(f"[+] Report saved to: {args.output}")
+        if args.record:
+            cassette.save()
+            print(f"[+] Cassette saved to: {args.record} ({len(cassette.interactions)} provider responses)")
+        if workspace is not None:
+            reused = [name for name, result in scan.stages.items() if result.source.endswith(':workspace')]
+            print(f"[+] Stored as run {scan.workspace_run} in workspace {args.workspace} "
+                  f"({len(scan.stages) - len(reused)} stages run, {len(reused)} reused)")
+            previous = workspace.previous_run(scan)
+            if previous is not None:
+                print(f"[*] Changes since run {previous.workspace_run} ({previous.timestamp}):")
+                print(describe_diff(diff_scans(previous, scan)), end='')
+        if scan.timings and scan.timings.get('pstats'):
+            print(f"[+] cProfile statistics saved to: {scan.timings['pstats']}")
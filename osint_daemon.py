@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""
+Warm scan daemon for the OSINT reconnaissance tools
+Purpose: Keep phonenumbers metadata, HTTP pools and the response cache loaded between scans
+
+    python osint_recon_enhanced.py serve [--socket PATH] [--api-key KEY] [--metrics-port 9464] ...
+    python osint_recon_enhanced.py +919876543210 --daemon --authorization engagement.json
+
+The daemon listens on a Unix socket (mode 0600). A client sends one JSON line
+per connection:
+
+    {"op": "scan", "profile": "enhanced", "phone": "...", "email": null,
+     "authorization": {"file": "/abs/engagement.json"} or {"token": "v1...."},
+     "only": null, "skip": null, "deadline": null, "timings": false, "pstats": null}
+
+and reads back the scan as JSONL report records (scan, one per stage, summary)
+as stages finish, or a single {"type": "error"} record. {"op": "ping"} answers
+with the daemon's pid and uptime. Every job must carry an authorization that
+covers its target; there is no interactive prompt to fall back to.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import signal
+import socket
+import socketserver
+import sys
+import time
+
+from osint_auth import Authorization, AuthorizationError
+from osint_cache import cache_from_args
+from osint_metrics import serve_metrics, write_textfile_at_exit
+from osint_profile import ScanProfiler
+from osint_ratelimit import limiter_from_args
+from osint_report import JSONLReportWriter, to_json
+from osint_results import ScanResult, StageResult
+
+DEFAULT_SOCKET_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'osint_recon', 'daemon.sock')
+
+# Number parsed at startup so the first job doesn't pay for loading metadata
+WARMUP_NUMBER = '+14155552671'
+
+
+class DaemonError(Exception):
+    """Raised by the client when the daemon is unreachable or rejects a job"""
+
+
+def _quiet(event, data):
+    pass
+
+
+def _terminate(signum, frame):
+    # SIGTERM (e.g. from a service manager) shuts down like Ctrl-C, removing the socket
+    raise KeyboardInterrupt
+
+
+class ScanRequestHandler(socketserver.StreamRequestHandler):
+    """One job per connection: read a JSON request line, stream JSONL records back"""
+
+    def _send(self, stream, record):
+        stream.write(to_json(record) + '\n')
+        stream.flush()
+
+    def handle(self):
+        stream = io.TextIOWrapper(self.wfile, encoding='utf-8', write_through=True)
+        try:
+            request = json.loads(self.rfile.readline())
+            op = request.get('op', 'scan')
+            if op == 'ping':
+                self._send(stream, {'type': 'pong', 'pid': os.getpid(),
+                                    'uptime': round(time.monotonic() - self.server.started, 3)})
+            elif op == 'scan':
+                self._scan(stream, request)
+            else:
+                self._send(stream, {'type': 'error', 'error': f"Unknown op '{op}'"})
+        except BrokenPipeError:
+            pass  # client went away mid-scan
+        except Exception as e:
+            try:
+                self._send(stream, {'type': 'error', 'error': f'{type(e).__name__}: {e}'})
+            except OSError:
+                pass
+        finally:
+            stream.detach()
+
+    def _scan(self, stream, request):
+        engine = self.server.engines.get(request.get('profile', 'enhanced'))
+        if engine is None:
+            raise ValueError(f"Unknown profile '{request.get('profile')}'")
+        if not request.get('phone'):
+            raise ValueError('Job has no phone number')
+        # Checked per job, before anything is looked up
+        authorization = authorization_from_request(request.get('authorization'))
+        profiler = None
+        if request.get('timings') or request.get('pstats'):
+            profiler = ScanProfiler(request.get('pstats'))
+        scan = engine.comprehensive_scan(
+            request['phone'], request.get('email'), deadline=request.get('deadline'),
+            only=request.get('only'), skip=request.get('skip'), report=JSONLReportWriter(stream),
+            progress=_quiet, authorization=authorization, profiler=profiler
+        )
+        if scan.error:
+            self._send(stream, {'type': 'error', 'error': scan.error})
+
+
+def authorization_from_request(value):
+    """Authorization from a job's {"file": ...} or {"token": ...}"""
+    if not isinstance(value, dict):
+        raise AuthorizationError('Job carries no authorization file or token')
+    if value.get('token'):
+        return Authorization.from_token(value['token'])
+    if value.get('file'):
+        return Authorization.from_file(value['file'])
+    raise AuthorizationError('Job carries no authorization file or token')
+
+
+class ReconDaemon(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Unix-socket server holding warm engines for both tool profiles"""
+
+    daemon_threads = True
+
+    def __init__(self, socket_path, engines):
+        self.engines = engines
+        self.started = time.monotonic()
+        self.socket_path = socket_path
+        os.makedirs(os.path.dirname(os.path.abspath(socket_path)), exist_ok=True)
+        if os.path.exists(socket_path):
+            if ping(socket_path, timeout=1.0) is not None:
+                raise DaemonError(f'A daemon is already serving {socket_path}')
+            os.unlink(socket_path)
+        # Only the owning user may submit jobs
+        old_umask = os.umask(0o177)
+        try:
+            super().__init__(socket_path, ScanRequestHandler)
+        finally:
+            os.umask(old_umask)
+
+    def warm_up(self):
+        """Load phonenumbers metadata, the link templates and the HTTP sessions before the first job"""
+        from osint_links import link_registry
+
+        link_registry()
+        for engine in self.engines.values():
+            target = engine.parse_target(WARMUP_NUMBER)
+            engine.get_enhanced_phone_info(target)
+            engine.session
+
+    def server_close(self):
+        super().server_close()
+        try:
+            os.unlink(self.socket_path)
+        except OSError:
+            pass
+
+
+def _connect(socket_path, timeout=None):
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        sock.connect(socket_path)
+    except OSError as e:
+        sock.close()
+        raise DaemonError(f'No daemon listening on {socket_path} ({e.strerror or e})')
+    return sock
+
+
+def request_records(socket_path, request, timeout=None):
+    """Send one request and yield the daemon's JSONL records as they arrive"""
+    with _connect(socket_path, timeout) as sock:
+        sock.sendall((json.dumps(request) + '\n').encode('utf-8'))
+        with sock.makefile('r', encoding='utf-8') as lines:
+            for line in lines:
+                yield json.loads(line)
+
+
+def ping(socket_path=DEFAULT_SOCKET_PATH, timeout=2.0):
+    """The daemon's pong record, or None if nothing is listening"""
+    try:
+        return next(request_records(socket_path, {'op': 'ping'}, timeout), None)
+    except (DaemonError, OSError, ValueError):
+        return None
+
+
+def remote_scan(phone_number, email=None, *, authorization, profile='enhanced', deadline=None, only=None,
+                skip=None, report=None, timings=False, pstats_path=None, socket_path=DEFAULT_SOCKET_PATH):
+    """Run a scan on the daemon and return its ScanResult, feeding report as records arrive
+
+    authorization is {"file": path} or {"token": token}; relative file paths
+    (and pstats_path) are resolved here because the daemon has its own working directory.
+    """
+    if authorization.get('file'):
+        authorization = {'file': os.path.abspath(authorization['file'])}
+    request = {'op': 'scan', 'profile': profile, 'phone': str(phone_number), 'email': email,
+               'authorization': authorization, 'deadline': deadline, 'only': only, 'skip': skip,
+               'timings': timings, 'pstats': os.path.abspath(pstats_path) if pstats_path else None}
+    scan = None
+    for record in request_records(socket_path, request):
+        kind = record.pop('type', None)
+        if kind == 'error':
+            raise DaemonError(record['error'])
+        if kind == 'scan':
+            scan = ScanResult(record['target'], record['timestamp'], engagement=record.get('engagement'))
+            if report is not None:
+                report.begin(scan)
+        elif kind == 'stage':
+            result = StageResult.from_dict(record)
+            scan.stages[result.stage] = result
+            if report is not None:
+                report.section(result)
+        elif kind == 'summary':
+            scan.timed_out, scan.cache, scan.quota = record['timed_out'], record['cache'], record['quota']
+            scan.timings = record.get('timings')
+            scan.error, scan.workspace_run = record.get('error'), record.get('workspace_run')
+            if report is not None:
+                report.end(scan)
+    if scan is None:
+        raise DaemonError('Daemon closed the connection without a result')
+    return scan
+
+
+def client_main(args, profile, layout, report_stream, only=None, skip=None):
+    """--daemon path of the CLIs: submit the job and stream the daemon's report locally"""
+    from osint_report import report_writer
+
+    authorization = {'token': args.auth_token} if args.auth_token else {'file': args.authorization}
+    print(f"[*] Submitting scan for {args.phone} to the daemon at {args.socket}")
+    with (open(args.output, 'w') if args.output else contextlib.nullcontext(report_stream)) as stream:
+        try:
+            scan = remote_scan(args.phone, args.email, authorization=authorization, profile=profile,
+                               deadline=args.deadline, only=only, skip=skip,
+                               report=report_writer(args.format, stream, layout),
+                               timings=args.profile, pstats_path=args.pstats, socket_path=args.socket)
+        except (DaemonError, OSError) as e:
+            print(f"[-] {e}")
+            sys.exit(1)
+    if args.output:
+        print(f"[+] Report saved to: {args.output}")
+    if scan.timings and scan.timings.get('pstats'):
+        print(f"[+] cProfile statistics saved by the daemon to: {scan.timings['pstats']}")
+
+
+def serve_main(argv=None):
+    """Entry point for `osint_recon_enhanced.py serve` / `osint_recon.py serve`"""
+    from osint_cli import add_provider_arguments, provider_options_from_args
+    from osint_recon import OSINTRecon
+    from osint_recon_enhanced import EnhancedOSINTRecon
+
+    parser = argparse.ArgumentParser(prog='osint-recon serve', description='Warm OSINT scan daemon on a Unix socket')
+    parser.add_argument('--socket', default=DEFAULT_SOCKET_PATH, help='Socket path (default: %(default)s)')
+    parser.add_argument('--api-key', help='Numverify API key used for every job')
+    add_provider_arguments(parser)
+    parser.add_argument('--prefix-regions', metavar='REGIONS', help='Comma-separated regions served from the compact prefix index')
+    parser.add_argument('--stage-timeout', type=float, default=15.0, help='Per-stage timeout in seconds (default: %(default)s)')
+    parser.add_argument('--metrics-port', type=int, help='Serve Prometheus metrics on http://HOST:PORT/metrics')
+    parser.add_argument('--metrics-host', default='127.0.0.1', help='Address for --metrics-port (default: %(default)s)')
+    parser.add_argument('--metrics-textfile', metavar='FILE', help='Write Prometheus metrics to FILE on shutdown (node_exporter textfile collector)')
+    args = parser.parse_args(argv)
+    args.refresh = False
+    try:
+        endpoints = provider_options_from_args(args)
+    except ValueError as e:
+        parser.error(str(e))
+
+    prefix_index = None
+    if args.prefix_regions:
+        from osint_prefix_index import PrefixIndex
+        prefix_index = PrefixIndex.load_or_build(args.prefix_regions)
+
+    # Both profiles share one cache, one set of rate limits and one quota ledger
+    cache, limiter = cache_from_args(args), limiter_from_args(args)
+    engines = {
+        profile: engine_class(api_key=args.api_key, stage_timeout=args.stage_timeout, cache=cache,
+                              limiter=limiter, prefix_index=prefix_index, progress=_quiet,
+                              endpoints=endpoints)
+        for profile, engine_class in (('enhanced', EnhancedOSINTRecon), ('basic', OSINTRecon))
+    }
+
+    try:
+        server = ReconDaemon(args.socket, engines)
+    except DaemonError as e:
+        print(f"[-] {e}")
+        sys.exit(1)
+    signal.signal(signal.SIGTERM, _terminate)
+    if args.metrics_textfile:
+        write_textfile_at_exit(args.metrics_textfile)
+    if args.metrics_port is not None:
+        try:
+            serve_metrics(args.metrics_port, args.metrics_host)
+        except OSError as e:
+            server.server_close()
+            print(f"[-] Cannot serve metrics on {args.metrics_host}:{args.metrics_port}: {e}")
+            sys.exit(1)
+        print(f"[+] Metrics on http://{args.metrics_host}:{args.metrics_port}/metrics")
+    start = time.perf_counter()
+    server.warm_up()
+    print(f"[+] Warmed up in {time.perf_counter() - start:.2f}s; serving on {args.socket} (pid {os.getpid()})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n[*] Shutting down")
+    finally:
+        server.server_close()
@@ -0,0 +1,551 @@
+#!/usr/bin/env python3
+"""
+Shared scan engine for the OSINT reconnaissance tools
+Purpose: One set of stage implementations and a stage registry behind both CLIs
+"""
+
+import logging
+import threading
+import time
+from urllib.parse import quote
+
+from osint_links import render_links, target_fields
+from osint_metrics import SCANS, SCANS_IN_PROGRESS, STAGE_LATENCY, STAGE_RUNS
+from osint_profile import current_profiler
+from osint_target import ParsedTarget
+from osint_scheduler import Stage, StageScheduler, StageSkipped, STATUS_OK, current_cache_hits, request_timeout
+from osint_ratelimit import ProviderLimiter
+from osint_results import BreachCheck, NumverifyLookup, PhoneInfo, ScanResult, StageResult
+
+DEFAULT_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+NUMVERIFY_URL = 'http://apilayer.net/api/validate'
+HIBP_BREACHED_ACCOUNT_URL = 'https://haveibeenpwned.com/api/v3/breachedaccount/'
+
+# Provider -> URL its stage calls; ReconEngine(endpoints=...) can point them at stand-ins
+PROVIDER_ENDPOINTS = {
+    'numverify': NUMVERIFY_URL,
+    'hibp': HIBP_BREACHED_ACCOUNT_URL,
+}
+
+logger = logging.getLogger('osint_recon')
+
+
+class StageSpec:
+    """Registry entry describing how to run one stage"""
+
+    __slots__ = ('name', 'run', 'requires', 'network', 'description', 'source')
+
+    def __init__(self, name, run, requires=(), network=False, description='', source='local'):
+        self.name = name
+        self.run = run
+        self.requires = tuple(requires)
+        self.network = network
+        self.description = description
+        # Provider the stage's data comes from, recorded on its StageResult
+        self.source = source
+
+
+class ScanContext:
+    """Per-scan inputs handed to every stage"""
+
+    __slots__ = ('target', 'email', 'results', 'cached', '_link_fields')
+
+    def __init__(self, target, email=None):
+        self.target = target
+        self.email = email
+        # StageResults of completed stages, for stages that declare `requires`
+        self.results = {}
+        # Stages answered from the response cache, recorded in their StageResult.source
+        self.cached = set()
+        self._link_fields = None
+
+    @property
+    def link_fields(self):
+        """Encoded template fields for the target, built on first use and shared by every link stage"""
+        if self._link_fields is None:
+            self._link_fields = target_fields(self.target, self.email)
+        return self._link_fields
+
+
+# Stage name -> StageSpec, in registration order
+STAGE_REGISTRY = {}
+
+
+def register_stage(name, run, requires=(), network=False, description='', source='local'):
+    """Register a stage; run(engine, context) returns the stage's data or raises"""
+    for dependency in requires:
+        if dependency not in STAGE_REGISTRY:
+            raise ValueError(f"Stage '{name}' requires unknown stage '{dependency}'")
+    STAGE_REGISTRY[name] = StageSpec(name, run, requires, network, description, source)
+    return STAGE_REGISTRY[name]
+
+
+def track_cache_hits(name, run):
+    """Wrap a network stage so a response cache hit is noted in ScanContext.cached"""
+    def run_stage(engine, context):
+        hits = set()
+        token = current_cache_hits.set(hits)
+        try:
+            return run(engine, context)
+        finally:
+            current_cache_hits.reset(token)
+            if hits:
+                context.cached.add(name)
+    return run_stage
+
+
+def parse_stage_list(value):
+    """Split a comma-separated --only/--skip value into stage names"""
+    if not value:
+        return None
+    return [name.strip() for name in value.split(',') if name.strip()]
+
+
+def select_stages(profile, only=None, skip=None):
+    """Resolve which registered stages to run, in profile order, pulling in dependencies"""
+    for name in list(only or ()) + list(skip or ()):
+        if name not in STAGE_REGISTRY:
+            raise ValueError(f"Unknown stage '{name}' (available: {', '.join(STAGE_REGISTRY)})")
+
+    wanted = [name for name in profile if not only or name in only]
+    if only:
+        wanted += [name for name in only if name not in wanted]
+    wanted = [name for name in wanted if name not in (skip or ())]
+
+    selected = []
+
+    def add(name):
+        if name in selected:
+            return
+        for dependency in STAGE_REGISTRY[name].requires:
+            add(dependency)
+        selected.append(name)
+
+    for name in wanted:
+        add(name)
+    return selected
+
+
+def check_endpoints(endpoints):
+    """Raise ValueError for unknown providers, or two providers sent to the same URL"""
+    seen = {}
+    for provider, url in (endpoints or {}).items():
+        if provider not in PROVIDER_ENDPOINTS:
+            raise ValueError(f"Unknown provider '{provider}' (available: {', '.join(PROVIDER_ENDPOINTS)})")
+        # Providers may share a host:port, but the session tells them apart by path
+        key = url.split('?', 1)[0].lower()
+        if key in seen:
+            raise ValueError(f"Endpoints for {seen[key]} and {provider} are the same URL ({url})")
+        seen[key] = provider
+
+
+def endpoints_from_args(args):
+    """Provider endpoint overrides from repeated --endpoint PROVIDER=URL options"""
+    endpoints = {}
+    for value in args.endpoint or ():
+        provider, _, url = value.partition('=')
+        provider = provider.strip()
+        if provider not in PROVIDER_ENDPOINTS or not url.startswith(('http://', 'https://')):
+            raise ValueError(f"Invalid endpoint '{value}', expected PROVIDER=URL with provider one of "
+                             f"{', '.join(PROVIDER_ENDPOINTS)}")
+        endpoints[provider] = url
+    check_endpoints(endpoints)
+    return endpoints
+
+
+def log_progress(event, data):
+    """Default progress sink: the 'osint_recon' logger"""
+    logger.info('%s %s', event, data)
+
+
+def print_progress(event, data):
+    """Progress sink for the CLIs, printing the familiar [*] lines"""
+    if event == 'scan_started':
+        print(f"[*] Starting comprehensive OSINT scan for: {data['phone']}")
+        if data['email']:
+            print(f"[*] Additional email target: {data['email']}")
+    elif event == 'stage_reused':
+        print(f"[*] Reusing {data['stage']} from the workspace (fetched {data['fetched']})")
+
+
+class ReconEngine:
+    """Stage implementations shared by OSINTRecon and EnhancedOSINTRecon"""
+
+    # Stages run by default, in report order; subclasses pick their own
+    profile = ()
+    user_agent = DEFAULT_USER_AGENT
+
+    def __init__(self, api_key=None, stage_timeout=15.0, cache=None, limiter=None, prefix_index=None,
+                 progress=None, endpoints=None, cassette=None):
+        check_endpoints(endpoints)
+        self.endpoints = dict(PROVIDER_ENDPOINTS)
+        self.endpoints.update(endpoints or {})
+        self.cache = cache
+        # Optional osint_cassette.Cassette; scans then record provider responses or replay them offline
+        self.cassette = cassette
+        self.limiter = limiter if limiter is not None else ProviderLimiter()
+        self.numverify_api_key = api_key
+        # Optional osint_prefix_index.PrefixIndex answering basic_info lookups for its regions
+        self.prefix_index = prefix_index
+        # progress(event, data) receives scan_started, stage_finished and scan_finished events
+        self.progress = progress if progress is not None else log_progress
+        self.scheduler = StageScheduler(default_timeout=stage_timeout)
+        self._session = None
+        self._session_lock = threading.Lock()
+
+    @property
+    def session(self):
+        """HTTP session, built on first use so offline-only scans never import requests"""
+        with self._session_lock:
+            if self._session is None:
+                from osint_transport import ReconSession
+
+                moved = {provider: url for provider, url in self.endpoints.items()
+                         if url != PROVIDER_ENDPOINTS[provider]}
+                # A cassette sees every provider attempt, so cached answers are bypassed
+                self._session = ReconSession(cache=self.cache if self.cassette is None else None,
+                                             limiter=self.limiter, endpoints=moved, cassette=self.cassette)
+                self._session.headers.update({'User-Agent': self.user_agent})
+            return self._session
+
+    @session.setter
+    def session(self, session):
+        self._session = session
+
+    def parse_target(self, phone_number):
+        """Parse phone number once, returning a ParsedTarget or None if invalid"""
+        try:
+            target = ParsedTarget.coerce(phone_number)
+        except:
+            return None
+        return target if target.valid else None
+
+    def validate_phone_number(self, phone_number):
+        """Validate and format phone number"""
+        target = self.parse_target(phone_number)
+        return target.e164 if target else None
+
+    def get_enhanced_phone_info(self, target):
+        """Get comprehensive phone information as a PhoneInfo"""
+        target = ParsedTarget.coerce(target)
+        parsed_number = target.parsed
+        if self.prefix_index is not None and self.prefix_index.covers(parsed_number):
+            country = self.prefix_index.description_for_number(parsed_number)
+            carrier_name = self.prefix_index.name_for_number(parsed_number)
+            time_zones = self.prefix_index.time_zones_for_number(parsed_number)
+        else:
+            # Carrier/geocoder/timezone metadata is large; load it only when this stage runs
+            from phonenumbers import carrier, geocoder, timezone
+
+            country = geocoder.description_for_number(parsed_number, "en")
+            carrier_name = carrier.name_for_number(parsed_number, "en")
+            time_zones = timezone.time_zones_for_number(parsed_number)
+        return PhoneInfo(
+            valid=target.valid,
+            country=country,
+            carrier=carrier_name,
+            timezones=tuple(time_zones),
+            number_type=self._get_number_type(parsed_number),
+            national_format=target.national,
+            international_format=target.international,
+            e164_format=target.e164
+        )
+
+    def _get_number_type(self, parsed_number):
+        """Determine phone number type"""
+        import phonenumbers
+
+        number_type = phonenumbers.number_type(parsed_number)
+        if number_type == phonenumbers.PhoneNumberType.MOBILE:
+            return "Mobile"
+        elif number_type == phonenumbers.PhoneNumberType.FIXED_LINE:
+            return "Landline"
+        elif number_type == phonenumbers.PhoneNumberType.VOIP:
+            return "VOIP"
+        else:
+            return "Unknown"
+
+    def enhanced_reverse_phone_lookup(self, target):
+        """Perform enhanced reverse phone lookup using Numverify API, returning a NumverifyLookup"""
+        replaying = self.cassette is not None and self.cassette.replaying
+        if not self.numverify_api_key and not replaying:
+            raise StageSkipped('No API key provided')
+        
+        target = ParsedTarget.coerce(target)
+        params = {'access_key': self.numverify_api_key, 'number': target.e164}
+        response = self.session.get(self.endpoints['numverify'], params=params, timeout=request_timeout(10))
+        if response.status_code != 200:
+            raise RuntimeError(f'API request failed with status {response.status_code}')
+        data = response.json()
+        # Bad keys and exhausted plans come back as 200 with success=false
+        if data.get('success') is False:
+            raise RuntimeError(f"Numverify error: {data.get('error', {}).get('info', 'unknown error')}")
+        return NumverifyLookup.from_dict(data)
+
+    def search_social_media_profiles(self, target, email=None, fields=None):
+        """Search for social media profiles using phone number and email"""
+        # Email-based searches are only rendered when an email is provided
+        return {'search_urls': render_links('social_media_search', ParsedTarget.coerce(target), email, fields)}
+
+    def generate_email_patterns(self, target, name_variations=None):
+        """Generate potential email patterns based on phone number"""
+        target = ParsedTarget.coerce(target)
+        clean_number = target.digits
+        short_number = target.national_number
+        
+        email_patterns = {}
+        
+        # Common email providers
+        providers = ['gmail.com', 'yahoo.com', 'hotmail.com', 'outlook.com', 'rediffmail.com', 'icloud.com']
+        
+        # Phone-based email patterns
+        for provider in providers:
+            email_patterns[f'full_phone_{provider}'] = f'{clean_number}@{provider}'
+            email_patterns[f'short_phone_{provider}'] = f'{short_number}@{provider}'
+            email_patterns[f'phone91_{provider}'] = f'91{short_number}@{provider}'
+        
+        # Common Indian email patterns
+        indian_patterns = {
+            'jio_pattern': f'{short_number}@jio.com',
+            'airtel_pattern': f'{short_number}@airtel.com',
+            'vodafone_pattern': f'{short_number}@vodafone.com'
+        }
+        email_patterns.update(indian_patterns)
+        
+        return email_patterns
+
+    def search_public_databases(self, target, fields=None):
+        """Search public databases and directories"""
+        return render_links('public_databases', ParsedTarget.coerce(target), fields=fields)
+
+    def check_data_breaches(self, email=None, target=None):
+        """Check data breaches using public APIs, returning a BreachCheck"""
+        check = BreachCheck(email=email)
+        
+        if email:
+            # Have I Been Pwned API (email)
+            url = self.endpoints['hibp'] + quote(email, safe='@')
+            headers = {'User-Agent': 'OSINT-Recon-Tool'}
+            response = self.session.get(url, headers=headers, timeout=request_timeout(10))
+            if response.status_code == 200:
+                check.breached = True
+                check.breaches = response.json()
+            elif response.status_code == 404:
+                # HIBP answers 404 when the account is in no known breach
+                check.breached = False
+            else:
+                raise RuntimeError(f'API error: {response.status_code}')
+        
+        # Phone number breach checking (limited availability)
+        if target:
+            check.phone_note = 'Check: https://haveibeenpwned.com/ (Phone breach data limited)'
+        
+        return check
+
+    def reverse_username_search(self, target):
+        """Generate potential usernames from phone number"""
+        target = ParsedTarget.coerce(target)
+        clean_number = target.digits
+        short_number = target.national_number
+        
+        username_patterns = {
+            'full_phone': clean_number,
+            'short_phone': short_number,
+            'phone_with_91': f'91{short_number}',
+            'phone_jio': f'jio{short_number}',
+            'phone_user': f'user{short_number}',
+            'phone_mobile': f'mobile{short_number}'
+        }
+        
+        return username_patterns
+
+    def generate_investigation_links(self, target, email=None, fields=None):
+        """Generate direct investigation links"""
+        return render_links('investigation_links', ParsedTarget.coerce(target), email, fields)
+
+    def search_social_media(self, target, email=None):
+        """Search for social media profiles using phone number"""
+        results = {}
+        phone_number = ParsedTarget.coerce(target).e164
+        
+        # Search patterns for common social media platforms
+        search_patterns = {
+            'facebook': f'site:facebook.com "{phone_number}"',
+            'linkedin': f'site:linkedin.com "{phone_number}"',
+            'twitter': f'site:twitter.com "{phone_number}"',
+            'instagram': f'site:instagram.com "{phone_number}"'
+        }
+        
+        for platform, query in search_patterns.items():
+            try:
+                # This would typically use search APIs - placeholder for implementation
+                results[platform] = f"Search query: {query}"
+            except Exception as e:
+                results[platform] = f"Error: {str(e)}"
+                
+        return results
+
+    def search_public_records(self, target):
+        """Search public records and directories"""
+        # This would integrate with public record APIs
+        return {
+            'public_records': 'Integration with public record services required',
+            'business_directories': 'Check local business directories',
+            'government_records': 'Access authorized government databases'
+        }
+
+    def email_from_phone(self, target):
+        """Attempt to find associated email addresses"""
+        # This is speculative and requires proper authorization
+        target = ParsedTarget.coerce(target)
+        patterns = [
+            f"{target.e164}@",  # Pattern for phone-based emails
+            f"{target.digits}@"
+        ]
+        
+        results = {}
+        for pattern in patterns:
+            results[f'pattern_{pattern}'] = f"Search for emails containing: {pattern}"
+            
+        return results
+
+    def _target_summary(self, target, email):
+        """Value stored as ScanResult.target"""
+        return {
+            'phone': target.raw,
+            'validated_format': target.e164,
+            'email': email
+        }
+
+    def _stage_result(self, name, value, status, seconds, cached=False):
+        """Wrap a scheduler outcome in a StageResult"""
+        if status == STATUS_OK:
+            data, error = value, None
+        else:
+            data, error = None, value.get('error') if isinstance(value, dict) else str(value)
+        source = STAGE_REGISTRY[name].source
+        if cached:
+            source += ':cache'
+        return StageResult(name, status, data, error, round(seconds, 4), source)
+
+    def comprehensive_scan(self, phone_number, email=None, deadline=None, only=None, skip=None, report=None,
+                           progress=None, authorization=None, profiler=None, workspace=None):
+        """Perform comprehensive OSINT scan, optionally within a deadline in seconds, returning a ScanResult
+
+        report, if given, is an osint_report.ReportWriter that is handed each
+        stage's StageResult as soon as the stage finishes. progress overrides
+        the engine's progress sink for this scan. authorization, if given, is an
+        osint_auth.Authorization that must cover the target (AuthorizationError otherwise).
+        profiler, if given, is an osint_profile.ScanProfiler whose figures end up in ScanResult.timings.
+        workspace, if given, is an osint_workspace.Workspace: stages with a fresh
+        result stored there are reused instead of run, and the scan is stored as a new run.
+        """
+        progress = progress or self.progress
+        progress('scan_started', {'phone': str(phone_number), 'email': email})
+        
+        started_at = time.time()
+        timestamp = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(started_at))
+        # Validate phone number first; every stage below shares this ParsedTarget
+        target = self.parse_target(phone_number)
+        if not target:
+            SCANS.inc('invalid_target')
+            return ScanResult({'phone': str(phone_number), 'validated_format': None, 'email': email}, timestamp,
+                              error='Invalid phone number format')
+        
+        if authorization is not None:
+            try:
+                authorization.check(target.e164, email)
+            except Exception:
+                SCANS.inc('unauthorized')
+                raise
+        
+        scan = ScanResult(self._target_summary(target, email), timestamp,
+                          engagement=authorization.engagement if authorization is not None else None)
+        if report is not None:
+            report.begin(scan)
+        
+        # Network stages overlap each other; URL/pattern stages run inline meanwhile
+        context = ScanContext(target, email)
+        selected = select_stages(self.profile, only, skip)
+        reused = workspace.fresh_results(scan, selected) if workspace is not None else {}
+        # When each stage's data was produced, for the workspace
+        fetched_at = {}
+        for name, (stored, fetched) in reused.items():
+            result = context.results[name] = StageResult(name, STATUS_OK, stored.data, None, 0.0,
+                                                         f'{STAGE_REGISTRY[name].source}:workspace')
+            fetched_at[name] = fetched
+            progress('stage_reused', {'stage': name, 'fetched': time.strftime('%Y-%m-%d %H:%M:%S',
+                                                                              time.localtime(fetched))})
+            if report is not None:
+                report.section(result)
+        stages = []
+        for name in selected:
+            if name in reused:
+                continue
+            spec = STAGE_REGISTRY[name]
+            run = track_cache_hits(name, spec.run) if spec.network else spec.run
+            if profiler is not None:
+                run = profiler.wrap(name, run)
+            requires = [dependency for dependency in spec.requires if dependency not in reused]
+            stages.append(Stage(name, run, (self, context), network=spec.network, requires=requires))
+
+        def on_complete(name, value, status, seconds):
+            result = context.results[name] = self._stage_result(name, value, status, seconds, name in context.cached)
+            fetched_at[name] = time.time()
+            STAGE_RUNS.inc(name, status)
+            STAGE_LATENCY.observe(seconds, name)
+            progress('stage_finished', {'stage': name, 'status': status, 'latency': result.latency})
+            if report is not None:
+                report.section(result)
+
+        cache = self.cache
+        cache_before = cache.stats() if cache else None
+        # Network stages see the profiler through the context the scheduler copies for them
+        profiler_token = current_profiler.set(profiler)
+        SCANS_IN_PROGRESS.inc()
+        try:
+            stage_results, _, _ = self.scheduler.run(stages, deadline=deadline, on_complete=on_complete)
+        finally:
+            SCANS_IN_PROGRESS.dec()
+            current_profiler.reset(profiler_token)
+        SCANS.inc('completed')
+        # Declared stage order, reused stages included
+        scan.stages = {name: context.results[name] for name in selected if name in reused or name in stage_results}
+        if profiler is not None:
+            scan.timings = profiler.summary(scan.stages)
+            if not profiler.dump_stats():
+                scan.timings.pop('pstats', None)
+        scan.finish(cache.stats_since(cache_before) if cache else {'disabled': True}, self.limiter.usage())
+        if workspace is not None:
+            scan.workspace_run = workspace.record(scan, started_at, fetched_at, reused)
+        progress('scan_finished', {'phone': target.e164, 'timed_out': scan.timed_out})
+        if report is not None:
+            report.end(scan)
+        
+        return scan
+
+
+register_stage('basic_info', lambda engine, ctx: engine.get_enhanced_phone_info(ctx.target),
+               description='Validity, region, carrier, time zones, number type and formats')
+register_stage('enhanced_lookup', lambda engine, ctx: engine.enhanced_reverse_phone_lookup(ctx.target),
+               network=True, description='Numverify reverse lookup', source='numverify')
+register_stage('social_media_search',
+               lambda engine, ctx: engine.search_social_media_profiles(ctx.target, ctx.email, ctx.link_fields),
+               description='Social media search URLs')
+register_stage('social_media', lambda engine, ctx: engine.search_social_media(ctx.target, ctx.email),
+               description='Social media search-engine queries')
+register_stage('email_patterns', lambda engine, ctx: engine.generate_email_patterns(ctx.target),
+               description='Candidate phone-based email addresses')
+register_stage('public_databases', lambda engine, ctx: engine.search_public_databases(ctx.target, ctx.link_fields),
+               description='Public phone directory links')
+register_stage('public_records', lambda engine, ctx: engine.search_public_records(ctx.target),
+               description='Public record source checklist')
+register_stage('data_breaches', lambda engine, ctx: engine.check_data_breaches(ctx.email, ctx.target),
+               network=True, description='Have I Been Pwned breach check', source='hibp')
+register_stage('username_patterns', lambda engine, ctx: engine.reverse_username_search(ctx.target),
+               description='Candidate usernames')
+register_stage('email_associations', lambda engine, ctx: engine.email_from_phone(ctx.target),
+               description='Phone-based email search patterns')
+register_stage('investigation_links',
+               lambda engine, ctx: engine.generate_investigation_links(ctx.target, ctx.email, ctx.link_fields),
+               description='Search engine links')
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Investigation link templates for the OSINT reconnaissance tools
+Purpose: Render search/directory links from a declarative table with correct URL encoding
+
+Templates live in link_templates.json, grouped by section. A placeholder is
+written {field:encoding}; the table is compiled into str.format patterns once
+per process, on first use, and each section is rendered only when its stage
+runs. A scan builds one EncodedFields for its target (ScanContext.link_fields)
+and passes it to every link stage, so each field value is encoded at most
+once per scan.
+"""
+
+import json
+import os
+import re
+import threading
+from urllib.parse import quote, quote_plus
+
+DEFAULT_TEMPLATES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'link_templates.json')
+
+# Encoding name -> function applied to the field value before it is inserted
+ENCODERS = {
+    # Form-encoded query value: ' ' -> '+', '+' -> '%2B', '@' -> '%40', '"' -> '%22'
+    'query': quote_plus,
+    # Exact-phrase search term: wrapped in double quotes, then form-encoded
+    'phrase': lambda value: quote_plus(f'"{value}"'),
+    # Single path segment: everything but unreserved characters and '@' is escaped
+    'path': lambda value: quote(value, safe='@'),
+    'raw': str,
+}
+
+_PLACEHOLDER = re.compile(r'\{(\w+)(?::(\w+))?\}')
+_KEY_SEPARATOR = '__'
+
+
+def _escape_braces(text):
+    return text.replace('{', '{{').replace('}', '}}')
+
+
+class LinkTemplate:
+    """One template compiled to a str.format pattern over encoded-field keys"""
+
+    __slots__ = ('name', 'pattern', 'requires')
+
+    def __init__(self, name, url, requires=()):
+        self.name = name
+        pieces = []
+        fields = set(requires)
+        pos = 0
+        for match in _PLACEHOLDER.finditer(url):
+            field, encoding = match.group(1), match.group(2) or 'query'
+            if encoding not in ENCODERS:
+                raise ValueError(f"Template '{name}' uses unknown encoding '{encoding}'")
+            pieces.append(_escape_braces(url[pos:match.start()]))
+            pieces.append('{' + field + _KEY_SEPARATOR + encoding + '}')
+            fields.add(field)
+            pos = match.end()
+        pieces.append(_escape_braces(url[pos:]))
+        self.pattern = ''.join(pieces)
+        self.requires = frozenset(fields)
+
+    def render(self, encoded):
+        """Build the URL from an EncodedFields mapping"""
+        return self.pattern.format_map(encoded)
+
+
+class EncodedFields(dict):
+    """Field values for one target, each encoded on first use and then reused across templates"""
+
+    def __init__(self, values):
+        super().__init__()
+        self.values = {field: str(value) for field, value in values.items() if value}
+        self.present = frozenset(self.values)
+
+    def __missing__(self, key):
+        field, _, encoding = key.partition(_KEY_SEPARATOR)
+        value = self[key] = ENCODERS[encoding](self.values[field])
+        return value
+
+
+class LinkRegistry:
+    """Compiled templates by section"""
+
+    def __init__(self, sections):
+        self.sections = sections
+
+    @classmethod
+    def load(cls, path=DEFAULT_TEMPLATES_PATH):
+        with open(path, encoding='utf-8') as f:
+            table = json.load(f)
+        return cls({
+            section: [LinkTemplate(t['name'], t['url'], t.get('requires', ())) for t in templates]
+            for section, templates in table.items()
+            if not section.startswith('_')
+        })
+
+    def render(self, section, fields):
+        """Render one section as {name: url}, skipping templates whose fields are missing"""
+        if not isinstance(fields, EncodedFields):
+            fields = EncodedFields(fields)
+        return {
+            template.name: template.render(fields)
+            for template in self.sections[section]
+            if template.requires <= fields.present
+        }
+
+
+_registry = None
+_registry_lock = threading.Lock()
+
+
+def link_registry():
+    """Process-wide registry, loaded and compiled on first use"""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = LinkRegistry.load()
+        return _registry
+
+
+def target_fields(target, email=None):
+    """Template field values for a ParsedTarget and optional email"""
+    return EncodedFields({
+        'digits': target.digits,
+        'national_number': target.national_number,
+        'e164': target.e164,
+        'country_code': target.country_code,
+        'region': target.region,
+        'email': email,
+    })
+
+
+def render_links(section, target, email=None, fields=None):
+    """Render one section of the link registry for a target, reusing fields (from target_fields) if given"""
+    return link_registry().render(section, fields if fields is not None else target_fields(target, email))
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+Metrics for the OSINT reconnaissance tools
+Purpose: Counters and latency histograms from the transport and stage layers, in Prometheus text format
+
+    python osint_recon_enhanced.py serve --metrics-port 9464
+    python osint_recon_enhanced.py +919876543210 --metrics-textfile /var/lib/node_exporter/osint_recon.prom
+
+Every engine in the process records into the module-level REGISTRY. It can be
+served on /metrics from a background thread (serve_metrics) or written for the
+node_exporter textfile collector (write_textfile, write_textfile_at_exit).
+"""
+
+import atexit
+import bisect
+import os
+import tempfile
+import threading
+
+# Seconds; provider calls are tens of ms to several seconds, local stages well under 1ms
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_value(value):
+    if value == float('inf'):
+        return '+Inf'
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class Metric:
+    """One metric family; values are keyed by a tuple of label values in labelnames order"""
+
+    __slots__ = ('name', 'help', 'labelnames', '_values', '_lock')
+    kind = 'untyped'
+
+    def __init__(self, name, help, labelnames=()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels):
+        if len(labels) != len(self.labelnames):
+            raise ValueError(f'{self.name} takes labels {self.labelnames}, got {labels}')
+        return tuple(str(label) for label in labels)
+
+    def _labels(self, key, extra=()):
+        pairs = list(zip(self.labelnames, key)) + list(extra)
+        if not pairs:
+            return ''
+        return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in pairs) + '}'
+
+    def samples(self):
+        """(suffix, labels text, value) lines for the exposition"""
+        with self._lock:
+            return [('', self._labels(key), value) for key, value in sorted(self._values.items())]
+
+    def value(self, *labels):
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+    def exposition(self):
+        lines = [f'# HELP {self.name} {self.help}', f'# TYPE {self.name} {self.kind}']
+        lines += [f'{self.name}{suffix}{labels} {_format_value(value)}' for suffix, labels, value in self.samples()]
+        return '\n'.join(lines) + '\n'
+
+
+class Counter(Metric):
+    __slots__ = ()
+    kind = 'counter'
+
+    def inc(self, *labels, amount=1):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+
+class Gauge(Metric):
+    __slots__ = ()
+    kind = 'gauge'
+
+    def set(self, value, *labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, *labels, amount=1):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, *labels, amount=1):
+        self.inc(*labels, amount=-amount)
+
+
+class Histogram(Metric):
+    """Cumulative-bucket histogram; each label set keeps [bucket counts..., sum, count]"""
+
+    __slots__ = ('buckets',)
+    kind = 'histogram'
+
+    def __init__(self, name, help, labelnames=(), buckets=LATENCY_BUCKETS):
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value, *labels):
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [0] * (len(self.buckets) + 2)
+            if index < len(self.buckets):
+                state[index] += 1
+            state[-2] += value
+            state[-1] += 1
+
+    def value(self, *labels):
+        """Observation count for the label set"""
+        with self._lock:
+            state = self._values.get(self._key(labels))
+            return state[-1] if state else 0
+
+    def samples(self):
+        samples = []
+        with self._lock:
+            items = sorted((key, list(state)) for key, state in self._values.items())
+        for key, state in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets, state):
+                cumulative += count
+                samples.append(('_bucket', self._labels(key, [('le', _format_value(bound))]), cumulative))
+            samples.append(('_bucket', self._labels(key, [('le', '+Inf')]), state[-1]))
+            samples.append(('_sum', self._labels(key), round(state[-2], 6)))
+            samples.append(('_count', self._labels(key), state[-1]))
+        return samples
+
+
+class MetricsRegistry:
+    """Named metric families, exposed together"""
+
+    def __init__(self):
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def _register(self, cls, name, *args, **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, *args, **kwargs)
+            elif not isinstance(metric, cls):
+                raise ValueError(f'Metric {name} is already registered as a {metric.kind}')
+            return metric
+
+    def counter(self, name, help, labelnames=()):
+        return self._register(Counter, name, help, labelnames)
+
+    def gauge(self, name, help, labelnames=()):
+        return self._register(Gauge, name, help, labelnames)
+
+    def histogram(self, name, help, labelnames=(), buckets=LATENCY_BUCKETS):
+        return self._register(Histogram, name, help, labelnames, buckets=buckets)
+
+    def exposition(self):
+        """Every metric in Prometheus text format"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return ''.join(metric.exposition() for metric in metrics)
+
+
+REGISTRY = MetricsRegistry()
+
+# Transport layer (osint_transport.ReconSession)
+HTTP_REQUESTS = REGISTRY.counter(
+    'osint_http_requests_total', 'Provider HTTP attempts by status code (or exception name)', ('provider', 'status'))
+HTTP_LATENCY = REGISTRY.histogram(
+    'osint_http_request_duration_seconds', 'Provider HTTP attempt latency', ('provider',))
+HTTP_RETRIES = REGISTRY.counter(
+    'osint_http_retries_total', 'Provider HTTP attempts repeated after a retryable failure', ('provider',))
+CACHE_LOOKUPS = REGISTRY.counter(
+    'osint_cache_lookups_total', 'Response cache lookups by result (hit or miss)', ('provider', 'result'))
+BREAKER_TRIPS = REGISTRY.counter(
+    'osint_circuit_breaker_trips_total', 'Times a provider circuit breaker opened', ('provider',))
+PROVIDER_REFUSED = REGISTRY.counter(
+    'osint_provider_calls_refused_total', 'Provider calls not sent (circuit_open, quota or deadline)',
+    ('provider', 'reason'))
+RATE_LIMIT_WAIT = REGISTRY.counter(
+    'osint_rate_limit_wait_seconds_total', 'Time spent waiting for provider rate limits', ('provider',))
+
+# Stage layer (osint_engine.ReconEngine.comprehensive_scan)
+SCANS = REGISTRY.counter('osint_scans_total', 'Scans by outcome (completed, invalid_target, unauthorized)', ('outcome',))
+SCANS_IN_PROGRESS = REGISTRY.gauge('osint_scans_in_progress', 'Scans currently running')
+STAGE_RUNS = REGISTRY.counter('osint_stage_runs_total', 'Stage runs by final status', ('stage', 'status'))
+STAGE_LATENCY = REGISTRY.histogram('osint_stage_duration_seconds', 'Stage wall time', ('stage',))
+
+
+def serve_metrics(port, host='127.0.0.1', registry=REGISTRY):
+    """Serve /metrics from a daemon thread; returns the server (call shutdown() to stop)"""
+    # Imported here so CLI runs that never serve metrics don't pay for http.server
+    import http.server
+
+    class MetricsHandler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split('?', 1)[0] not in ('/metrics', '/'):
+                self.send_error(404)
+                return
+            body = registry.exposition().encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', CONTENT_TYPE)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer((host, port), MetricsHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name='osint-metrics', daemon=True).start()
+    return server
+
+
+def write_textfile(path, registry=REGISTRY):
+    """Write the exposition atomically, as the textfile collector expects"""
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix='.osint_metrics.')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(registry.exposition())
+        os.chmod(temp_path, 0o644)
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+def write_textfile_at_exit(path, registry=REGISTRY):
+    """Write the textfile when the process exits, however main() returns"""
+    def write():
+        try:
+            write_textfile(path, registry)
+        except OSError as e:
+            print(f"[-] Could not write metrics to {path}: {e}")
+    atexit.register(write)
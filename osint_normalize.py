@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+Offline phone inventory normalization for the OSINT reconnaissance tools
+Purpose: Validate a client's phone-asset CSV in bulk across every core, with no network stages
+
+    python osint_recon_enhanced.py normalize inventory.csv --region IN -o normalized.csv
+    python osint_recon_enhanced.py normalize inventory.csv --format jsonl --authorization engagement.json > out.jsonl
+
+The input is streamed in chunks to a process pool. Each worker parses its
+rows with ParsedTarget and runs the engine's basic_info logic
+(get_enhanced_phone_info). Numbers without a country code are read as
+national numbers of --region. Output keeps every input column and adds
+valid, e164, number_type, region, country, carrier and error, plus in_scope
+when an authorization is given. Rows come out in input order.
+"""
+
+import argparse
+import collections
+import concurrent.futures
+import contextlib
+import csv
+import json
+import os
+import sys
+import time
+
+NORMALIZED_FIELDS = ('valid', 'e164', 'number_type', 'region', 'country', 'carrier', 'error')
+
+# Header names taken for the phone column when --column is not given
+PHONE_COLUMNS = ('phone', 'phone_number', 'phonenumber', 'number', 'msisdn', 'mobile', 'telephone', 'tel')
+
+DEFAULT_CHUNK_SIZE = 2000
+
+# Engine and default region of a worker process, set by _init_worker
+_worker_engine = None
+_worker_region = None
+
+
+def _init_worker(region, prefix_regions=None):
+    """Build the worker's offline engine and load number metadata before the first chunk arrives"""
+    global _worker_engine, _worker_region
+    from osint_engine import ReconEngine
+
+    prefix_index = None
+    if prefix_regions:
+        from osint_prefix_index import PrefixIndex
+        prefix_index = PrefixIndex.load_or_build(prefix_regions)
+    _worker_engine = ReconEngine(prefix_index=prefix_index)
+    _worker_region = region
+    normalize_numbers(['+14155552671'])
+
+
+def normalize_numbers(numbers):
+    """NORMALIZED_FIELDS tuples for raw phone strings, in the calling worker's engine"""
+    from phonenumbers import NumberParseException
+    from osint_target import ParsedTarget
+
+    rows = []
+    for raw in numbers:
+        raw = (raw or '').strip()
+        if not raw:
+            rows.append((False, '', '', '', '', '', 'empty'))
+            continue
+        try:
+            target = ParsedTarget.parse(raw, _worker_region)
+        except NumberParseException as e:
+            rows.append((False, '', '', '', '', '', str(e)))
+            continue
+        info = _worker_engine.get_enhanced_phone_info(target)
+        rows.append((info.valid, info.e164_format, info.number_type, target.region or '', info.country,
+                     info.carrier, '' if info.valid else 'invalid number'))
+    return rows
+
+
+class CSVSink:
+    """Input columns followed by the normalized fields, as CSV"""
+
+    def __init__(self, stream, header, fields):
+        self.writer = csv.writer(stream)
+        self.width = len(header)
+        self.writer.writerow(list(header) + list(fields))
+
+    def write(self, row, normalized):
+        padded = (row + [''] * self.width)[:self.width]
+        self.writer.writerow(padded + list(normalized))
+
+
+class JSONLSink:
+    """One JSON object per row: input columns by header name, then the normalized fields"""
+
+    def __init__(self, stream, header, fields):
+        self.stream = stream
+        self.header = list(header)
+        self.fields = fields
+
+    def write(self, row, normalized):
+        record = dict(zip(self.header, row))
+        record.update(zip(self.fields, normalized))
+        self.stream.write(json.dumps(record, ensure_ascii=False) + '\n')
+
+
+NORMALIZE_FORMATS = {'csv': CSVSink, 'jsonl': JSONLSink}
+
+
+class NormalizeStats:
+    """Counts and throughput of one normalize run"""
+
+    __slots__ = ('rows', 'valid', 'in_scope', 'seconds', 'workers')
+
+    def __init__(self, workers):
+        self.rows = 0
+        self.valid = 0
+        self.in_scope = 0
+        self.seconds = 0.0
+        self.workers = workers
+
+    @property
+    def rows_per_second(self):
+        return self.rows / self.seconds if self.seconds else 0.0
+
+
+def phone_column(header, column=None):
+    """Index of the phone column: --column as a header name or 1-based number, else a known header name, else 0"""
+    names = [name.strip().lower() for name in header]
+    if column:
+        if column.isdigit() and 1 <= int(column) <= len(header):
+            return int(column) - 1
+        if column.strip().lower() in names:
+            return names.index(column.strip().lower())
+        raise ValueError(f"No column '{column}' in input (columns: {', '.join(header)})")
+    for name in PHONE_COLUMNS:
+        if name in names:
+            return names.index(name)
+    return 0
+
+
+def _chunks(reader, size):
+    chunk = []
+    for row in reader:
+        if not any(cell.strip() for cell in row):
+            continue  # blank lines
+        chunk.append(row)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _prepend(row, reader):
+    yield row
+    yield from reader
+
+
+def normalize_inventory(source, sink_stream, fmt='csv', column=None, region=None, workers=None,
+                        chunk_size=DEFAULT_CHUNK_SIZE, prefix_regions=None, authorization=None, header=True):
+    """Normalize a CSV stream into sink_stream, returning NormalizeStats
+
+    workers=1 normalizes in this process; otherwise chunks go to a process
+    pool with at most two chunks per worker in flight, so memory stays flat
+    however long the inventory is.
+    """
+    workers = workers or os.cpu_count() or 1
+    stats = NormalizeStats(workers)
+    start = time.perf_counter()
+    reader = csv.reader(source)
+    first = next(reader, None)
+    if first is None:
+        return stats
+    if header:
+        columns = first
+    else:
+        columns = [f'column{index + 1}' for index in range(len(first))]
+        reader = _prepend(first, reader)
+    index = phone_column(columns, column)
+    fields = NORMALIZED_FIELDS + (('in_scope',) if authorization is not None else ())
+    sink = NORMALIZE_FORMATS[fmt](sink_stream, columns, fields)
+
+    def write(chunk, results):
+        for row, normalized in zip(chunk, results):
+            stats.rows += 1
+            stats.valid += bool(normalized[0])
+            if authorization is not None:
+                in_scope = bool(normalized[0]) and authorization.covers_phone(normalized[1])
+                stats.in_scope += in_scope
+                normalized = tuple(normalized) + (in_scope,)
+            sink.write(row, normalized)
+
+    def numbers(chunk):
+        return [row[index] if index < len(row) else '' for row in chunk]
+
+    if workers == 1:
+        _init_worker(region, prefix_regions)
+        for chunk in _chunks(reader, chunk_size):
+            write(chunk, normalize_numbers(numbers(chunk)))
+    else:
+        if prefix_regions:
+            # Build the index once here so workers only load it
+            from osint_prefix_index import PrefixIndex
+            PrefixIndex.load_or_build(prefix_regions)
+        pending = collections.deque()
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                                    initargs=(region, prefix_regions)) as executor:
+            for chunk in _chunks(reader, chunk_size):
+                pending.append((chunk, executor.submit(normalize_numbers, numbers(chunk))))
+                if len(pending) >= workers * 2:
+                    chunk, future = pending.popleft()
+                    write(chunk, future.result())
+            while pending:
+                chunk, future = pending.popleft()
+                write(chunk, future.result())
+    stats.seconds = time.perf_counter() - start
+    return stats
+
+
+def normalize_main(argv=None):
+    """Entry point for `osint_recon_enhanced.py normalize` / `osint_recon.py normalize`"""
+    from osint_auth import AuthorizationError, authorization_from_args
+
+    parser = argparse.ArgumentParser(prog='osint-recon normalize',
+                                     description='Validate and normalize a phone inventory CSV offline')
+    parser.add_argument('input', help="Inventory CSV ('-' for stdin)")
+    parser.add_argument('-o', '--output', help='Output file (default: stdout)')
+    parser.add_argument('--format', choices=NORMALIZE_FORMATS, default='csv', help='Output format (default: %(default)s)')
+    parser.add_argument('--column', help='Phone column, by header name or 1-based number (default: first of '
+                                         f"{', '.join(PHONE_COLUMNS)}, else the first column)")
+    parser.add_argument('--no-header', action='store_true', help='The input has no header row')
+    parser.add_argument('--region', type=str.upper, help='Region (e.g. IN) for numbers written without a country code')
+    parser.add_argument('--workers', type=int, help=f'Worker processes (default: CPU count, {os.cpu_count()})')
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE, help='Rows per job (default: %(default)s)')
+    parser.add_argument('--prefix-regions', metavar='REGIONS', help='Comma-separated regions served from the compact prefix index')
+    parser.add_argument('--authorization', metavar='FILE', help='Engagement authorization file; adds an in_scope column')
+    parser.add_argument('--auth-token', metavar='TOKEN', help='Signed engagement token; adds an in_scope column')
+    args = parser.parse_args(argv)
+    if args.workers is not None and args.workers < 1 or args.chunk_size < 1:
+        parser.error('--workers and --chunk-size must be at least 1')
+    if args.region:
+        import phonenumbers
+        if args.region not in phonenumbers.SUPPORTED_REGIONS:
+            parser.error(f"Unknown region '{args.region}'")
+    try:
+        authorization = authorization_from_args(args)
+    except AuthorizationError as e:
+        parser.error(str(e))
+
+    try:
+        source = sys.stdin if args.input == '-' else open(args.input, newline='', encoding='utf-8-sig')
+    except OSError as e:
+        parser.error(f'Cannot read {args.input}: {e}')
+    sink = open(args.output, 'w', newline='', encoding='utf-8') if args.output else contextlib.nullcontext(sys.stdout)
+    # Normalized rows on stdout get stdout to themselves
+    chatter = sys.stderr if not args.output else sys.stdout
+    with source, sink as sink, contextlib.redirect_stdout(chatter):
+        print(f"[*] Normalizing {args.input} with {args.workers or os.cpu_count()} worker(s)")
+        try:
+            stats = normalize_inventory(source, sink, args.format, args.column, args.region, args.workers,
+                                        args.chunk_size, args.prefix_regions, authorization, not args.no_header)
+        except ValueError as e:
+            print(f"[-] {e}")
+            sys.exit(1)
+        print(f"[+] Normalized {stats.rows} rows ({stats.valid} valid, {stats.rows - stats.valid} invalid) "
+              f"in {stats.seconds:.2f}s: {stats.rows_per_second:.0f} rows/s")
+        if authorization is not None:
+            print(f"[+] {stats.in_scope} rows in scope of engagement {authorization.engagement}")
+        if args.output:
+            print(f"[+] Written to: {args.output}")
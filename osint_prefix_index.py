@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+Region-restricted prefix index for geocoder/carrier/timezone lookups
+Purpose: Answer basic_info lookups without loading phonenumbers' full per-prefix metadata
+
+The index is built once from phonenumbers' GEOCODE_DATA, CARRIER_DATA and
+TIMEZONE_DATA, keeping only the prefixes of the configured regions' country
+calling codes, and cached on disk as sorted integer arrays plus a string table.
+Lookups mirror geocoder.description_for_number, carrier.name_for_number and
+timezone.time_zones_for_number for English output.
+"""
+
+import bisect
+import marshal
+import os
+from array import array
+
+import phonenumbers
+from phonenumbers import PhoneNumberType
+from phonenumbers.phonenumberutil import (
+    NumberParseException,
+    country_mobile_token,
+    is_number_type_geographical,
+    is_valid_number_for_region,
+    national_significant_number,
+    number_type,
+    region_code_for_country_code,
+    region_codes_for_country_code,
+)
+
+INDEX_FORMAT = 1
+DEFAULT_INDEX_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'osint_recon')
+LANG = 'en'
+
+UNKNOWN_TIMEZONE = 'Etc/Unknown'
+_TZ_SEPARATOR = '&'
+
+
+def _parse_regions(regions):
+    if isinstance(regions, str):
+        regions = regions.split(',')
+    return tuple(sorted({region.strip().upper() for region in regions if region.strip()}))
+
+
+def default_index_path(regions, directory=DEFAULT_INDEX_DIR):
+    """Cache file for an index over these regions built from the installed phonenumbers"""
+    return os.path.join(
+        directory, f"prefix_index-{'-'.join(_parse_regions(regions))}-{phonenumbers.__version__}.marshal"
+    )
+
+
+class PrefixTable:
+    """Sorted integer prefixes with a parallel array of string-table indexes"""
+
+    __slots__ = ('prefixes', 'values', 'longest')
+
+    def __init__(self, prefixes, values, longest):
+        self.prefixes = prefixes
+        self.values = values
+        self.longest = longest
+
+    @classmethod
+    def from_mapping(cls, mapping, intern):
+        """Build from {prefix string: value}; E.164 prefixes never start with 0, so int keys are unique"""
+        items = sorted((int(prefix), intern(value)) for prefix, value in mapping.items())
+        longest = max((len(prefix) for prefix in mapping), default=0)
+        return cls(array('Q', (k for k, _ in items)), array('I', (v for _, v in items)), longest)
+
+    def get(self, prefix):
+        """String-table index for an exact prefix, or -1"""
+        key = int(prefix)
+        i = bisect.bisect_left(self.prefixes, key)
+        if i < len(self.prefixes) and self.prefixes[i] == key:
+            return self.values[i]
+        return -1
+
+    def longest_match(self, digits):
+        """String-table index for the longest prefix of digits present in the table, or -1"""
+        for length in range(min(self.longest, len(digits)), 0, -1):
+            value = self.get(digits[:length])
+            if value >= 0:
+                return value
+        return -1
+
+
+class PrefixIndex:
+    """Compact geocoder/carrier/timezone index for a fixed set of regions"""
+
+    def __init__(self, regions, country_codes, strings, geo, carrier, tz, tz_longest, region_names, version):
+        self.regions = regions
+        self.country_codes = frozenset(country_codes)
+        self.strings = strings
+        self.geo = geo
+        self.carrier = carrier
+        self.tz = tz
+        # Longest prefix across the *whole* timezone table; the country-level fallback depends on it
+        self.tz_longest = tz_longest
+        self.region_names = region_names
+        self.version = version
+
+    @classmethod
+    def build(cls, regions):
+        """Build from the full phonenumbers metadata (slow; done once per region set)"""
+        from phonenumbers.geodata import GEOCODE_DATA
+        from phonenumbers.geodata.locale import LOCALE_DATA
+        from phonenumbers.carrierdata import CARRIER_DATA
+        from phonenumbers.tzdata import TIMEZONE_DATA, TIMEZONE_LONGEST_PREFIX
+
+        regions = _parse_regions(regions)
+        country_codes = sorted({phonenumbers.country_code_for_region(region) for region in regions} - {0})
+        if not country_codes:
+            raise ValueError(f"No known regions in {', '.join(regions) or 'empty list'}")
+        prefixes = [str(cc) for cc in country_codes]
+
+        def relevant(key):
+            # Keys starting with a calling code, plus shorter keys a lookup could fall back to
+            return any(key.startswith(cc) or cc.startswith(key) for cc in prefixes)
+
+        strings = []
+        positions = {}
+
+        def intern(value):
+            if value not in positions:
+                positions[value] = len(strings)
+                strings.append(value)
+            return positions[value]
+
+        def english(table):
+            # _find_lang(langdict, 'en') with no script/region is a plain 'en' lookup
+            return {key: names[LANG] for key, names in table.items() if relevant(key) and LANG in names}
+
+        geo = PrefixTable.from_mapping(english(GEOCODE_DATA), intern)
+        carrier = PrefixTable.from_mapping(english(CARRIER_DATA), intern)
+        tz = PrefixTable.from_mapping(
+            {key: _TZ_SEPARATOR.join(zones) for key, zones in TIMEZONE_DATA.items() if relevant(key)}, intern
+        )
+
+        region_names = {}
+        for cc in country_codes:
+            for region in region_codes_for_country_code(cc):
+                name = LOCALE_DATA.get(region, {}).get(LANG, '')
+                if name.startswith('*'):
+                    name = LOCALE_DATA[region].get(name[1:], '')
+                region_names[region] = name
+
+        return cls(regions, country_codes, strings, geo, carrier, tz, TIMEZONE_LONGEST_PREFIX,
+                   region_names, phonenumbers.__version__)
+
+    def save(self, path):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        payload = {
+            'format': INDEX_FORMAT,
+            'version': self.version,
+            'regions': list(self.regions),
+            'country_codes': sorted(self.country_codes),
+            'strings': self.strings,
+            'tables': {
+                name: (table.prefixes.tobytes(), table.values.tobytes(), table.longest)
+                for name, table in (('geo', self.geo), ('carrier', self.carrier), ('tz', self.tz))
+            },
+            'tz_longest': self.tz_longest,
+            'region_names': self.region_names,
+        }
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            marshal.dump(payload, f)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        """Load a saved index, or return None if it is missing or stale"""
+        try:
+            with open(path, 'rb') as f:
+                payload = marshal.load(f)
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+        if payload.get('format') != INDEX_FORMAT or payload.get('version') != phonenumbers.__version__:
+            return None
+
+        tables = {}
+        for name, (prefix_bytes, value_bytes, longest) in payload['tables'].items():
+            prefixes, values = array('Q'), array('I')
+            prefixes.frombytes(prefix_bytes)
+            values.frombytes(value_bytes)
+            tables[name] = PrefixTable(prefixes, values, longest)
+        return cls(tuple(payload['regions']), payload['country_codes'], payload['strings'],
+                   tables['geo'], tables['carrier'], tables['tz'], payload['tz_longest'],
+                   payload['region_names'], payload['version'])
+
+    @classmethod
+    def load_or_build(cls, regions, directory=DEFAULT_INDEX_DIR):
+        """Load the cached index for these regions, building and saving it on first use"""
+        path = default_index_path(regions, directory)
+        index = cls.load(path)
+        if index is None:
+            index = cls.build(regions)
+            index.save(path)
+        return index
+
+    def covers(self, numobj):
+        return numobj.country_code in self.country_codes
+
+    def _lookup(self, table, numobj):
+        value = table.longest_match(phonenumbers.format_number(numobj, phonenumbers.PhoneNumberFormat.E164)[1:])
+        return self.strings[value] if value >= 0 else ''
+
+    def _region_display_name(self, region_code):
+        return self.region_names.get(region_code, '')
+
+    def _country_name_for_number(self, numobj):
+        region_codes = region_codes_for_country_code(numobj.country_code)
+        if len(region_codes) == 1:
+            return self._region_display_name(region_codes[0])
+        region_where_number_is_valid = 'ZZ'
+        for region_code in region_codes:
+            if is_valid_number_for_region(numobj, region_code):
+                if region_where_number_is_valid != 'ZZ':
+                    return ''
+                region_where_number_is_valid = region_code
+        return self._region_display_name(region_where_number_is_valid)
+
+    def description_for_number(self, numobj):
+        """Same result as geocoder.description_for_number(numobj, 'en')"""
+        ntype = number_type(numobj)
+        if ntype == PhoneNumberType.UNKNOWN:
+            return ''
+        if not is_number_type_geographical(ntype, numobj.country_code):
+            return self._country_name_for_number(numobj)
+
+        lookup_numobj = numobj
+        mobile_token = country_mobile_token(numobj.country_code)
+        national_number = national_significant_number(numobj)
+        if mobile_token and national_number.startswith(mobile_token):
+            try:
+                lookup_numobj = phonenumbers.parse(
+                    national_number[len(mobile_token):], region_code_for_country_code(numobj.country_code)
+                )
+            except NumberParseException:
+                pass
+        area_description = self._lookup(self.geo, lookup_numobj)
+        if area_description:
+            return area_description
+        return self._country_name_for_number(numobj)
+
+    def name_for_number(self, numobj):
+        """Same result as carrier.name_for_number(numobj, 'en')"""
+        ntype = number_type(numobj)
+        if ntype in (PhoneNumberType.MOBILE, PhoneNumberType.FIXED_LINE_OR_MOBILE, PhoneNumberType.PAGER):
+            return self._lookup(self.carrier, numobj)
+        return ''
+
+    def time_zones_for_number(self, numobj):
+        """Same result as timezone.time_zones_for_number(numobj)"""
+        ntype = number_type(numobj)
+        if ntype == PhoneNumberType.UNKNOWN:
+            return (UNKNOWN_TIMEZONE,)
+        if is_number_type_geographical(ntype, numobj.country_code):
+            value = self.tz.longest_match(phonenumbers.format_number(numobj, phonenumbers.PhoneNumberFormat.E164)[1:])
+        else:
+            # Mirrors timezone._country_level_time_zones_for_number, quirks included
+            cc = str(numobj.country_code)
+            value = -1
+            for prefix_len in range(self.tz_longest, 0, -1):
+                value = self.tz.get(cc[:(1 + prefix_len)])
+                if value >= 0:
+                    break
+        if value < 0:
+            return (UNKNOWN_TIMEZONE,)
+        return tuple(self.strings[value].split(_TZ_SEPARATOR))
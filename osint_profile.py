@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Scan profiling for the OSINT reconnaissance tools
+Purpose: Per-stage wall/CPU time, per-request connection phase timings and optional cProfile dumps
+
+    python osint_recon_enhanced.py +919876543210 --profile
+    python osint_recon_enhanced.py +919876543210 --pstats scan.pstats
+    python -m pstats scan.pstats
+
+A ScanProfiler is handed to comprehensive_scan(profiler=...) and lands in
+ScanResult.timings. Without one, stages run unwrapped and the transport's only
+extra work is a context variable lookup per request.
+"""
+
+import contextvars
+import threading
+import time
+from urllib.parse import urlsplit
+
+# Profiler of the scan running in this context; None when profiling is off
+current_profiler = contextvars.ContextVar('current_profiler', default=None)
+# Phase timings of the request being sent in this context, filled in by the transport's connections
+current_http_phases = contextvars.ContextVar('current_http_phases', default=None)
+
+# Connection phases in the order they happen; absent when a pooled connection was reused
+HTTP_PHASES = ('dns', 'connect', 'tls', 'first_byte')
+
+
+class ScanProfiler:
+    """Timings for one scan: wall/CPU per stage, phases per HTTP call, and cProfile stats if asked"""
+
+    def __init__(self, pstats_path=None):
+        # Where dump_stats() writes merged cProfile data; None skips cProfile entirely
+        self.pstats_path = pstats_path
+        self.stages = {}
+        self.http = []
+        # Stages cProfile could not attach to (another profiler already active on this interpreter)
+        self.unprofiled = []
+        self._profiles = []
+        self._lock = threading.Lock()
+
+    def _start_profile(self, name):
+        if self.pstats_path is None:
+            return None
+        import cProfile
+
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            # Python 3.12+ allows one active cProfile at a time; overlapping stages go without
+            self.unprofiled.append(name)
+            return None
+        return profile
+
+    def wrap(self, name, func):
+        """Stage function that records its own wall and CPU (this thread's) time"""
+        def profiled(*args):
+            profile = self._start_profile(name)
+            wall, cpu = time.perf_counter(), time.thread_time()
+            try:
+                return func(*args)
+            finally:
+                cpu, wall = time.thread_time() - cpu, time.perf_counter() - wall
+                if profile is not None:
+                    profile.disable()
+                with self._lock:
+                    self.stages[name] = {'wall': round(wall, 6), 'cpu': round(cpu, 6)}
+                    if profile is not None:
+                        self._profiles.append(profile)
+        return profiled
+
+    def timed_request(self, provider, method, url, attempt, send):
+        """Call send() (one HTTP attempt) and record its connection phases and total time"""
+        phases = {}
+        token = current_http_phases.set(phases)
+        start = time.perf_counter()
+        status = None
+        try:
+            response = send()
+            status = response.status_code
+            return response
+        except Exception as e:
+            status = type(e).__name__
+            raise
+        finally:
+            total = time.perf_counter() - start
+            current_http_phases.reset(token)
+            self.record_http(provider, method, url, status, total, phases, attempt=attempt)
+
+    def record_http(self, provider, method, url, status, total, phases=None, attempt=0, cached=False):
+        # Query strings carry API keys; keep scheme, host and path only
+        parts = urlsplit(url)
+        call = {
+            'provider': provider,
+            'method': method.upper(),
+            'url': f'{parts.scheme}://{parts.netloc}{parts.path}',
+            'status': status,
+            'attempt': attempt,
+            'cached': cached,
+        }
+        for phase in HTTP_PHASES:
+            value = (phases or {}).get(phase)
+            call[phase] = round(value, 6) if value is not None else None
+        call['total'] = round(total, 6)
+        with self._lock:
+            self.http.append(call)
+
+    def summary(self, order=()):
+        """JSON-safe timings for ScanResult.timings, stages in the given order"""
+        with self._lock:
+            stages = {name: dict(self.stages[name]) for name in order if name in self.stages}
+            stages.update((name, dict(value)) for name, value in self.stages.items() if name not in stages)
+            result = {'stages': stages, 'http': [dict(call) for call in self.http]}
+        if self.pstats_path is not None:
+            result['pstats'] = self.pstats_path
+            if self.unprofiled:
+                result['unprofiled'] = list(self.unprofiled)
+        return result
+
+    def dump_stats(self):
+        """Merge every stage's cProfile data into pstats_path; False if nothing was profiled"""
+        with self._lock:
+            profiles = list(self._profiles)
+        if self.pstats_path is None or not profiles:
+            return False
+        import pstats
+
+        stats = pstats.Stats(profiles[0])
+        for profile in profiles[1:]:
+            stats.add(profile)
+        stats.dump_stats(self.pstats_path)
+        return True
+
+
+def describe_timings(timings):
+    """Text report lines for ScanResult.timings"""
+    def ms(value):
+        return f'{value * 1000:.1f}ms' if value is not None else '-'
+
+    lines = []
+    for name, stage in timings.get('stages', {}).items():
+        lines.append(f"- {name}: wall {ms(stage['wall'])}, cpu {ms(stage['cpu'])}")
+    if timings.get('http'):
+        lines.append('HTTP calls:')
+    for call in timings.get('http', ()):
+        if call['cached']:
+            lines.append(f"- {call['method']} {call['url']}: served from cache")
+            continue
+        phases = ', '.join(f"{phase.replace('_', ' ')} {ms(call[phase])}" for phase in HTTP_PHASES)
+        retry = f" (retry {call['attempt']})" if call['attempt'] else ''
+        lines.append(f"- {call['method']} {call['url']} -> {call['status']}{retry}: {phases}, total {ms(call['total'])}")
+    if timings.get('pstats'):
+        lines.append(f"cProfile stats: {timings['pstats']}")
+    return '\n'.join(lines) + '\n'
@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Per-provider rate limiting and quota accounting for the OSINT reconnaissance tools
+Purpose: Pace outbound calls to what each provider allows and refuse before a quota is exceeded
+"""
+
+import os
+import sqlite3
+import threading
+import time
+
+from osint_scheduler import DeadlineExceeded, current_deadline
+
+DEFAULT_LEDGER_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'osint_recon', 'quota.sqlite3')
+
+# Requests per minute and burst size per provider (HIBP's lowest paid tier allows 10 rpm)
+DEFAULT_RATES = {
+    'numverify': (60.0, 2),
+    'hibp': (10.0, 1),
+}
+
+# Calls allowed per billing window ('month' or 'day'); Numverify free tier is 100/month
+DEFAULT_QUOTAS = {
+    'numverify': (100, 'month'),
+}
+
+
+class QuotaExhausted(Exception):
+    """Raised instead of calling a provider whose quota for the window is used up"""
+
+
+def billing_window(period, now=None):
+    """Identifier of the current billing window, e.g. '2026-10' or '2026-10-17' (UTC)"""
+    fmt = '%Y-%m-%d' if period == 'day' else '%Y-%m'
+    return time.strftime(fmt, time.gmtime(now))
+
+
+class TokenBucket:
+    """Classic token bucket: `rate` tokens per second, holding at most `burst`"""
+
+    __slots__ = ('rate', 'burst', 'tokens', 'updated', '_lock')
+
+    def __init__(self, rate, burst=1):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self):
+        """Take a token, returning how long the caller must wait before using it"""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+
+    def _refund(self):
+        with self._lock:
+            self.tokens = min(self.burst, self.tokens + 1)
+
+    def acquire(self):
+        """Block until a token is available, respecting the current deadline (scan deadline or stage timeout)"""
+        wait = self._reserve()
+        if wait <= 0:
+            return 0.0
+        deadline = current_deadline.get()
+        if deadline is not None and wait >= deadline.remaining():
+            self._refund()
+            raise DeadlineExceeded(f'Rate limit wait of {wait:.1f}s exceeds the {deadline.label.lower()}')
+        time.sleep(wait)
+        return wait
+
+
+class QuotaLedger:
+    """Persisted count of calls made per provider and billing window"""
+
+    def __init__(self, path=DEFAULT_LEDGER_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        if path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS usage (
+                provider TEXT NOT NULL,
+                window TEXT NOT NULL,
+                calls INTEGER NOT NULL,
+                PRIMARY KEY (provider, window)
+            )
+        """)
+
+    def used(self, provider, window):
+        with self._lock:
+            row = self._db.execute(
+                "SELECT calls FROM usage WHERE provider = ? AND window = ?", (provider, window)
+            ).fetchone()
+        return row[0] if row else 0
+
+    def reserve(self, provider, window, limit):
+        """Count one call against the window, or return False if that would exceed the limit"""
+        with self._lock:
+            # IMMEDIATE takes the write lock up front so concurrent CLIs can't both take the last call
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._db.execute(
+                    "SELECT calls FROM usage WHERE provider = ? AND window = ?", (provider, window)
+                ).fetchone()
+                calls = row[0] if row else 0
+                if calls >= limit:
+                    self._db.execute("ROLLBACK")
+                    return False
+                self._db.execute(
+                    "INSERT INTO usage VALUES (?, ?, 1) "
+                    "ON CONFLICT (provider, window) DO UPDATE SET calls = calls + 1",
+                    (provider, window)
+                )
+                self._db.execute("COMMIT")
+                return True
+            except Exception:
+                self._db.execute("ROLLBACK")
+                raise
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+
+class ProviderLimiter:
+    """Token buckets plus optional quota ledger that every provider call passes through"""
+
+    def __init__(self, rates=None, quotas=None, ledger=None):
+        self.rates = dict(DEFAULT_RATES)
+        if rates:
+            self.rates.update(rates)
+        self.quotas = dict(DEFAULT_QUOTAS)
+        if quotas:
+            self.quotas.update(quotas)
+        self.ledger = ledger
+        self._session_calls = {}
+        self._lock = threading.Lock()
+        self._buckets = {
+            provider: TokenBucket(per_minute / 60.0, burst)
+            for provider, (per_minute, burst) in self.rates.items()
+            if per_minute
+        }
+
+    def acquire(self, provider):
+        """Wait for the provider's rate limit, then reserve a call against its quota
+
+        Returns the seconds spent waiting for the rate limit.
+        """
+        bucket = self._buckets.get(provider)
+        waited = bucket.acquire() if bucket is not None else 0.0
+
+        quota = self.quotas.get(provider)
+        if quota:
+            limit, period = quota
+            window = billing_window(period)
+            if self.ledger is not None:
+                allowed = self.ledger.reserve(provider, window, limit)
+            else:
+                with self._lock:
+                    calls = self._session_calls.get((provider, window), 0)
+                    allowed = calls < limit
+                    if allowed:
+                        self._session_calls[(provider, window)] = calls + 1
+            if not allowed:
+                raise QuotaExhausted(
+                    f'{provider} quota of {limit} calls per {period} is used up for {window}; '
+                    f'not sending the request'
+                )
+        return waited
+
+    def usage(self):
+        """Calls used per quota-limited provider in the current window"""
+        summary = {}
+        for provider, (limit, period) in self.quotas.items():
+            window = billing_window(period)
+            if self.ledger is not None:
+                used = self.ledger.used(provider, window)
+            else:
+                used = self._session_calls.get((provider, window), 0)
+            summary[provider] = {'used': used, 'limit': limit, 'window': window}
+        return summary
+
+
+def parse_provider_overrides(values, cast=float):
+    """Parse repeated PROVIDER=VALUE options into a dict, raising ValueError for bad ones"""
+    known = DEFAULT_RATES.keys() | DEFAULT_QUOTAS.keys()
+    overrides = {}
+    for value in values or ():
+        provider, _, amount = value.partition('=')
+        provider = provider.strip()
+        if not amount:
+            raise ValueError(f"Invalid override '{value}', expected PROVIDER=VALUE")
+        if provider not in known:
+            raise ValueError(f"Unknown provider '{provider}' in '{value}' (limited providers: {', '.join(sorted(known))})")
+        try:
+            number = cast(amount)
+        except ValueError:
+            kind = 'whole number' if cast is int else 'number'
+            raise ValueError(f"Invalid value '{amount}' in '{value}', expected a {kind}") from None
+        if not number >= 0:
+            raise ValueError(f"Invalid value '{amount}' in '{value}', must be zero or more")
+        overrides[provider] = number
+    return overrides
+
+
+def limits_from_args(args):
+    """Rate and quota overrides from the CLI options, as (rates, quotas) for ProviderLimiter"""
+    rates = {
+        provider: (per_minute, DEFAULT_RATES.get(provider, (0, 1))[1])
+        for provider, per_minute in parse_provider_overrides(args.rate_limit).items()
+    }
+    quotas = {
+        provider: (calls, DEFAULT_QUOTAS.get(provider, (0, 'month'))[1])
+        for provider, calls in parse_provider_overrides(args.quota, int).items()
+    }
+    return rates, quotas
+
+
+def limiter_from_args(args):
+    """Build the provider limiter selected by the CLI options"""
+    rates, quotas = limits_from_args(args)
+    return ProviderLimiter(rates, quotas, QuotaLedger(args.quota_ledger))
+
+
+def describe_usage(usage):
+    """One-line summary of quota usage for reports"""
+    if not usage:
+        return 'none tracked'
+    return ', '.join(
+        f"{provider} {info['used']}/{info['limit']} ({info['window']})" for provider, info in usage.items()
+    )
@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Streaming report writers for the OSINT reconnaissance tools
+Purpose: Write each report section as its stage finishes, as text, JSON, JSONL or HTML
+"""
+
+import html
+import json
+
+from osint_cache import describe_stats
+from osint_profile import describe_timings
+from osint_ratelimit import describe_usage
+
+REPORT_FORMATS = ('text', 'json', 'jsonl', 'html')
+
+# ScanResult.to_dict() keys known before any stage finishes; every other key but 'stages' goes at the end
+HEADER_FIELDS = ('target', 'timestamp', 'engagement')
+
+
+def _split_summary(scan):
+    """ScanResult.to_dict() without stages, as (header fields, footer fields)"""
+    summary = scan.to_dict()
+    summary.pop('stages')
+    header = {key: summary.pop(key) for key in HEADER_FIELDS if key in summary}
+    return header, summary
+
+
+def _json_default(value):
+    # Payload dataclasses serialize themselves; anything else unexpected is shown as text
+    if hasattr(value, 'to_dict'):
+        return value.to_dict()
+    if isinstance(value, (set, frozenset)):
+        return sorted(value)
+    return str(value)
+
+
+def to_json(value, indent=None):
+    return json.dumps(value, indent=indent, default=_json_default, ensure_ascii=False)
+
+
+class ReportLayout:
+    """Report wording for one tool; the CLI recon classes override these"""
+
+    report_title = 'OSINT RECONNAISSANCE REPORT'
+    # (heading, body) blocks closing every report
+    report_notes = ()
+
+    def section_heading(self, name):
+        return name.replace('_', ' ').upper()
+
+    def _format_status(self, result):
+        """Line shown instead of data for a stage that did not succeed"""
+        return f"Status: {result.status} ({result.error})\n"
+
+    def _format_section(self, result):
+        """Render one StageResult as a text report section"""
+        heading = self.section_heading(result.stage)
+        body = to_json(result.data, indent=2) + "\n" if result.ok else self._format_status(result)
+        return f"\n{heading}:\n{'-' * (len(heading) + 1)}\n{body}"
+
+    def _report_header(self, scan):
+        """Text report lines known before any stage finishes"""
+        title = self.report_title
+        header = f"\n{title}\n{'=' * len(title)}\nGenerated: {scan.timestamp}\nTarget: {scan.target['validated_format']}\n"
+        if scan.engagement:
+            header += f"Engagement: {scan.engagement}\n"
+        return header
+
+    def _report_footer(self, scan):
+        """Text report lines written once every stage has finished"""
+        footer = f"""
+SCAN SUMMARY:
+-------------
+Timed out stages: {', '.join(scan.timed_out) or 'None'}
+Response cache: {describe_stats(scan.cache)}
+Provider quota: {describe_usage(scan.quota)}
+
+STAGE TIMINGS:
+--------------
+"""
+        for result in scan.stages.values():
+            reused = ', reused from workspace' if result.source.endswith(':workspace') else ''
+            footer += f"- {result.stage}: {result.latency:.3f}s ({result.status}{reused})\n"
+        if scan.timings:
+            footer += f"\nPROFILE TIMINGS:\n----------------\n{describe_timings(scan.timings)}"
+        for heading, body in self.report_notes:
+            footer += f"\n{heading}:\n{'-' * (len(heading) + 1)}\n{body}\n"
+        return footer
+
+
+class ReportWriter:
+    """Base writer: begin() once, section() per finished stage, end() once"""
+
+    def __init__(self, stream, layout=None):
+        self.stream = stream
+        self.layout = layout if layout is not None else ReportLayout()
+
+    def _write(self, text):
+        self.stream.write(text)
+        # Flushed per section so a reader tailing the output sees stages as they land
+        self.stream.flush()
+
+    def begin(self, scan):
+        pass
+
+    def section(self, result):
+        pass
+
+    def end(self, scan):
+        pass
+
+    def write_results(self, scan):
+        """Write a finished ScanResult in one pass"""
+        self.begin(scan)
+        for result in scan.stages.values():
+            self.section(result)
+        self.end(scan)
+
+
+class TextReportWriter(ReportWriter):
+    """The human-readable layout the CLIs have always printed"""
+
+    def begin(self, scan):
+        self._write(self.layout._report_header(scan))
+
+    def section(self, result):
+        self._write(self.layout._format_section(result))
+
+    def end(self, scan):
+        self._write(self.layout._report_footer(scan))
+
+
+class JSONReportWriter(ReportWriter):
+    """ScanResult.to_dict() as one JSON object, written a stage at a time (ScanResult.from_json reads it)"""
+
+    def begin(self, scan):
+        self._separator = ''
+        header, _ = _split_summary(scan)
+        self._write('{' + ''.join(f'{to_json(key)}: {to_json(value)}, ' for key, value in header.items())
+                    + '"stages": {')
+
+    def section(self, result):
+        self._write(f'{self._separator}{to_json(result.stage)}: {to_json(result.to_dict())}')
+        self._separator = ', '
+
+    def end(self, scan):
+        # Built from to_dict() so the streamed object can't drift from ScanResult's own fields
+        _, footer = _split_summary(scan)
+        self._write('}' + ''.join(f', {to_json(key)}: {to_json(value)}' for key, value in footer.items()) + '}\n')
+
+
+class JSONLReportWriter(ReportWriter):
+    """One JSON record per line: a scan record, a StageResult record per stage, then a summary record"""
+
+    def _record(self, record):
+        self._write(to_json(record) + '\n')
+
+    def begin(self, scan):
+        header, _ = _split_summary(scan)
+        self._record(dict(type='scan', **header))
+
+    def section(self, result):
+        self._record(dict(type='stage', **result.to_dict()))
+
+    def end(self, scan):
+        _, footer = _split_summary(scan)
+        self._record(dict(type='summary', **footer))
+
+
+class HTMLReportWriter(ReportWriter):
+    """Self-contained HTML page with one <section> per stage and clickable links"""
+
+    def begin(self, scan):
+        title = html.escape(self.layout.report_title)
+        self._write(
+            f'<!DOCTYPE html>\n<html lang="en">\n<head>\n<meta charset="utf-8">\n<title>{title}</title>\n'
+            '<style>body{font-family:sans-serif;margin:2em}pre{background:#f4f4f4;padding:1em;overflow:auto}'
+            'td,th{padding:.2em .8em;text-align:left}.timed_out,.error{color:#b00}</style>\n'
+            f'</head>\n<body>\n<h1>{title}</h1>\n<table>\n'
+            f'<tr><th>Generated</th><td>{html.escape(scan.timestamp)}</td></tr>\n'
+            + ''.join(f'<tr><th>{html.escape(str(key))}</th><td>{html.escape(str(value or "Not provided"))}</td></tr>\n'
+                      for key, value in scan.target.items())
+            + '</table>\n'
+        )
+
+    def _format_value(self, value):
+        if isinstance(value, dict) and 'search_urls' in value and len(value) == 1:
+            value = value['search_urls']
+        if isinstance(value, dict) and value and all(isinstance(v, str) for v in value.values()):
+            items = []
+            for key, entry in value.items():
+                if entry.startswith(('http://', 'https://')) and ' ' not in entry:
+                    entry = f'<a href="{html.escape(entry)}" rel="noreferrer">{html.escape(entry)}</a>'
+                else:
+                    entry = html.escape(entry)
+                items.append(f'<li>{html.escape(str(key))}: {entry}</li>\n')
+            return '<ul>\n' + ''.join(items) + '</ul>\n'
+        return f'<pre>{html.escape(to_json(value, indent=2))}</pre>\n'
+
+    def section(self, result):
+        heading = html.escape(self.layout.section_heading(result.stage))
+        status = html.escape(result.status)
+        body = self._format_value(result.data) if result.ok else f'<p class="{status}">{html.escape(result.error or "")}</p>\n'
+        self._write(
+            f'<section id="{html.escape(result.stage)}">\n<h2>{heading}</h2>\n'
+            f'<p class="{status}">{status} in {result.latency:.3f}s from {html.escape(result.source)}</p>\n'
+            + body + '</section>\n'
+        )
+
+    def end(self, scan):
+        rows = ''.join(
+            f'<tr><td>{html.escape(result.stage)}</td><td>{result.latency:.3f}s</td>'
+            f'<td class="{html.escape(result.status)}">{html.escape(result.status)}</td></tr>\n'
+            for result in scan.stages.values()
+        )
+        profile = ''
+        if scan.timings:
+            profile = f'<h2>PROFILE TIMINGS</h2>\n<pre>{html.escape(describe_timings(scan.timings))}</pre>\n'
+        notes = ''.join(
+            f'<h2>{html.escape(heading)}</h2>\n<pre>{html.escape(body)}</pre>\n'
+            for heading, body in self.layout.report_notes
+        )
+        self._write(
+            '<h2>SCAN SUMMARY</h2>\n<table>\n'
+            f'<tr><th>Timed out stages</th><td>{html.escape(", ".join(scan.timed_out) or "None")}</td></tr>\n'
+            f'<tr><th>Response cache</th><td>{html.escape(describe_stats(scan.cache))}</td></tr>\n'
+            f'<tr><th>Provider quota</th><td>{html.escape(describe_usage(scan.quota))}</td></tr>\n'
+            '</table>\n<h2>STAGE TIMINGS</h2>\n<table>\n' + rows + '</table>\n' + profile + notes + '</body>\n</html>\n'
+        )
+
+
+REPORT_WRITERS = {
+    'text': TextReportWriter,
+    'json': JSONReportWriter,
+    'jsonl': JSONLReportWriter,
+    'html': HTMLReportWriter,
+}
+
+
+def report_writer(fmt, stream, layout=None):
+    """Writer for a --format value"""
+    return REPORT_WRITERS[fmt](stream, layout)
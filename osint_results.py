@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Typed scan results for the OSINT reconnaissance tools
+Purpose: One explicit shape per stage result, with lossless JSON round-tripping
+
+Every stage produces a StageResult carrying its status, error, latency and
+source. Its data is either a plain dict (link and pattern tables) or one of the
+payload classes below. to_dict()/from_dict() turn each object into JSON-safe
+values and back without losing type information.
+"""
+
+import json
+from dataclasses import dataclass, field, fields
+from typing import Any, Optional
+
+from osint_scheduler import STATUS_OK, STATUS_TIMED_OUT
+
+# Payload class name -> class, for from_dict
+PAYLOAD_TYPES = {}
+
+
+def payload(cls):
+    """Register a payload dataclass so StageResult.from_dict can rebuild it"""
+    PAYLOAD_TYPES[cls.__name__] = cls
+    return cls
+
+
+class PayloadMixin:
+    """to_dict/from_dict for flat payload dataclasses whose tuple fields are listed in _tuples"""
+
+    __slots__ = ()
+    _tuples = ()
+
+    def to_dict(self):
+        result = {}
+        for f in fields(self):
+            value = getattr(self, f.name)
+            result[f.name] = list(value) if isinstance(value, tuple) else value
+        return result
+
+    @classmethod
+    def from_dict(cls, data):
+        known = {f.name for f in fields(cls)}
+        values = {k: v for k, v in data.items() if k in known}
+        for name in cls._tuples:
+            if values.get(name) is not None:
+                values[name] = tuple(values[name])
+        return cls(**values)
+
+
+@payload
+@dataclass(slots=True)
+class PhoneInfo(PayloadMixin):
+    """basic_info: offline validity, region, carrier, time zones, type and formats"""
+
+    _tuples = ('timezones',)
+
+    valid: bool
+    country: str
+    carrier: str
+    timezones: tuple
+    number_type: str
+    national_format: str
+    international_format: str
+    e164_format: str
+
+
+@payload
+@dataclass(slots=True)
+class NumverifyLookup(PayloadMixin):
+    """enhanced_lookup: Numverify validate response"""
+
+    valid: bool
+    number: str = ''
+    local_format: str = ''
+    international_format: str = ''
+    country_prefix: str = ''
+    country_code: str = ''
+    country_name: str = ''
+    location: str = ''
+    carrier: str = ''
+    line_type: Optional[str] = None
+
+
+@payload
+@dataclass(slots=True)
+class BreachCheck(PayloadMixin):
+    """data_breaches: HIBP breaches for the email, if one was given"""
+
+    email: Optional[str] = None
+    # None when no email was checked; otherwise whether HIBP knows of any breach
+    breached: Optional[bool] = None
+    # HIBP breach records, as returned (names only unless truncateResponse=false)
+    breaches: list = field(default_factory=list)
+    phone_note: str = ''
+
+
+@dataclass(slots=True)
+class StageResult:
+    """Outcome of one stage: data when status is ok, error otherwise"""
+
+    stage: str
+    status: str = STATUS_OK
+    data: Any = None
+    error: Optional[str] = None
+    # Wall time in seconds
+    latency: float = 0.0
+    # Where the data came from: 'local', a provider name, or 'provider:cache'
+    source: str = 'local'
+
+    @property
+    def ok(self):
+        return self.status == STATUS_OK
+
+    def to_dict(self):
+        data = self.data
+        data_type = None
+        if type(data).__name__ in PAYLOAD_TYPES:
+            data_type = type(data).__name__
+            data = data.to_dict()
+        return {
+            'stage': self.stage,
+            'status': self.status,
+            'data_type': data_type,
+            'data': data,
+            'error': self.error,
+            'latency': self.latency,
+            'source': self.source,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        value = data.get('data')
+        if data.get('data_type'):
+            value = PAYLOAD_TYPES[data['data_type']].from_dict(value)
+        return cls(data['stage'], data.get('status', STATUS_OK), value, data.get('error'),
+                   data.get('latency', 0.0), data.get('source', 'local'))
+
+
+@dataclass(slots=True)
+class ScanResult:
+    """A whole scan: target summary, stage results in declared order, and run statistics"""
+
+    target: dict
+    timestamp: str
+    stages: dict = field(default_factory=dict)
+    timed_out: list = field(default_factory=list)
+    cache: dict = field(default_factory=dict)
+    quota: dict = field(default_factory=dict)
+    error: Optional[str] = None
+    # Engagement the scan was authorized under, when authorized by file or token
+    engagement: Optional[str] = None
+    # osint_profile.ScanProfiler.summary() when the scan was profiled
+    timings: Optional[dict] = None
+    # osint_workspace run id the scan was stored as, when scanned into a workspace
+    workspace_run: Optional[int] = None
+
+    def __getitem__(self, name):
+        return self.stages[name]
+
+    def __contains__(self, name):
+        return name in self.stages
+
+    @property
+    def stage_status(self):
+        return {name: result.status for name, result in self.stages.items()}
+
+    def finish(self, cache, quota):
+        """Fill in the run statistics once every stage has finished"""
+        self.timed_out = [name for name, result in self.stages.items() if result.status == STATUS_TIMED_OUT]
+        self.cache = cache
+        self.quota = quota
+
+    def to_dict(self):
+        result = {
+            'target': self.target,
+            'timestamp': self.timestamp,
+            'stages': {name: stage.to_dict() for name, stage in self.stages.items()},
+            'timed_out': self.timed_out,
+            'cache': self.cache,
+            'quota': self.quota,
+        }
+        if self.error is not None:
+            result['error'] = self.error
+        if self.engagement is not None:
+            result['engagement'] = self.engagement
+        if self.timings is not None:
+            result['timings'] = self.timings
+        if self.workspace_run is not None:
+            result['workspace_run'] = self.workspace_run
+        return result
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(
+            data['target'], data['timestamp'],
+            {name: StageResult.from_dict(stage) for name, stage in data.get('stages', {}).items()},
+            data.get('timed_out', []), data.get('cache', {}), data.get('quota', {}), data.get('error'),
+            data.get('engagement'), data.get('timings'), data.get('workspace_run'),
+        )
+
+    def to_json(self, indent=None):
+        return json.dumps(self.to_dict(), indent=indent, ensure_ascii=False)
+
+    @classmethod
+    def from_json(cls, text):
+        return cls.from_dict(json.loads(text))
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Stage scheduler for the OSINT reconnaissance tools
+Purpose: Run independent network stages concurrently, CPU stages inline
+"""
+
+import concurrent.futures
+import contextvars
+import time
+
+STATUS_OK = 'ok'
+STATUS_ERROR = 'error'
+STATUS_TIMED_OUT = 'timed_out'
+STATUS_SKIPPED = 'skipped'
+
+# Deadline of the scan running in the current context (None = unbounded)
+current_deadline = contextvars.ContextVar('current_deadline', default=None)
+
+# Set of providers the running stage got answers for from the response cache (None outside tracked stages)
+current_cache_hits = contextvars.ContextVar('current_cache_hits', default=None)
+
+
+class DeadlineExceeded(Exception):
+    """Raised when the scan budget is spent before a request is sent"""
+
+
+class StageSkipped(Exception):
+    """Raised by a stage that has nothing to do (e.g. no API key or no email)"""
+
+
+class Deadline:
+    """Time budget (the whole scan, or one stage) that bounds outbound requests, retries and rate-limit waits"""
+
+    __slots__ = ('seconds', 'expires_at', 'label')
+
+    def __init__(self, seconds, label='Scan deadline'):
+        self.seconds = seconds
+        self.expires_at = time.monotonic() + seconds
+        self.label = label
+
+    @classmethod
+    def bounded(cls, deadline, seconds, label='Stage timeout'):
+        """Whichever expires first: deadline (may be None) or a new budget of seconds from now"""
+        own = cls(seconds, label)
+        if deadline is not None and deadline.expires_at <= own.expires_at:
+            return deadline
+        return own
+
+    def remaining(self):
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self):
+        return time.monotonic() >= self.expires_at
+
+    def clamp(self, timeout):
+        """Shrink a request timeout to the time left in the budget"""
+        remaining = self.remaining()
+        if remaining <= 0:
+            raise DeadlineExceeded(f'{self.label} of {self.seconds:g}s exceeded')
+        return min(timeout, remaining)
+
+
+def request_timeout(default):
+    """Timeout for an outbound request, bounded by the current scan deadline or stage timeout"""
+    deadline = current_deadline.get()
+    if deadline is None:
+        return default
+    return deadline.clamp(default)
+
+
+class Stage:
+    """A single scan stage: a result key, a callable, its arguments and its dependencies"""
+
+    __slots__ = ('name', 'func', 'args', 'network', 'timeout', 'requires')
+
+    def __init__(self, name, func, args=(), network=False, timeout=None, requires=()):
+        self.name = name
+        self.func = func
+        self.args = args
+        self.network = network
+        self.timeout = timeout
+        self.requires = tuple(requires)
+
+
+class StageScheduler:
+    """Run scan stages, overlapping the ones that wait on the network"""
+
+    def __init__(self, max_workers=4, default_timeout=15.0):
+        self.max_workers = max_workers
+        self.default_timeout = default_timeout
+
+    def _timed_call(self, stage, deadline=None):
+        """Run a stage, returning (value, status, wall time)"""
+        start = time.perf_counter()
+        try:
+            value = stage.func(*stage.args)
+            status = STATUS_OK
+        except DeadlineExceeded as e:
+            value = {'error': str(e)}
+            status = STATUS_TIMED_OUT
+        except StageSkipped as e:
+            value = {'error': str(e)}
+            status = STATUS_SKIPPED
+        except Exception as e:
+            value = {'error': str(e)}
+            status = STATUS_ERROR
+        # A stage that only returned because its requests ran out of budget isn't done
+        if deadline is not None and deadline.expired():
+            status = STATUS_TIMED_OUT
+        return value, status, time.perf_counter() - start
+
+    def run(self, stages, deadline=None, on_complete=None):
+        """Run all stages, returning (results, timings, status) keyed by stage name
+
+        Stages start once everything in their `requires` has finished. on_complete,
+        if given, is called as on_complete(name, value, status, seconds) as each
+        stage finishes, in completion order.
+        """
+        if deadline is not None and not isinstance(deadline, Deadline):
+            deadline = Deadline(deadline)
+        results = {}
+        timings = {}
+        status = {}
+        token = current_deadline.set(deadline)
+
+        def finish(stage, value, stage_status, seconds):
+            results[stage.name], status[stage.name], timings[stage.name] = value, stage_status, seconds
+            if on_complete is not None:
+                on_complete(stage.name, value, stage_status, seconds)
+
+        def expired_message(timeout=None):
+            if deadline is not None and deadline.expired():
+                return f'Scan deadline of {deadline.seconds:g}s exceeded'
+            return f'Stage timed out after {timeout:g}s'
+
+        waiting = list(stages)
+        in_flight = {}
+        executor = None
+        if any(stage.network for stage in stages):
+            executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(self.max_workers, sum(1 for stage in stages if stage.network)),
+                thread_name_prefix='osint-stage'
+            )
+
+        try:
+            while waiting or in_flight:
+                ready = [stage for stage in waiting if all(name in results for name in stage.requires)]
+                for stage in ready:
+                    waiting.remove(stage)
+
+                # Network stages go out first so CPU stages below run while they are in flight
+                for stage in ready:
+                    if not stage.network:
+                        continue
+                    timeout = stage.timeout if stage.timeout is not None else self.default_timeout
+                    # Each worker sees the scan deadline, tightened to its stage timeout, through its own
+                    # copy of the context: an abandoned stage's requests and retries stop when it times out
+                    # instead of keeping the process alive after the report is written
+                    context = contextvars.copy_context()
+                    context.run(current_deadline.set, Deadline.bounded(deadline, timeout))
+                    future = executor.submit(context.run, self._timed_call, stage, deadline)
+                    in_flight[future] = (stage, time.perf_counter(), timeout)
+
+                for stage in ready:
+                    if stage.network:
+                        continue
+                    if deadline is not None and deadline.expired():
+                        finish(stage, {'error': expired_message()}, STATUS_TIMED_OUT, 0.0)
+                    else:
+                        finish(stage, *self._timed_call(stage, deadline))
+
+                if ready and not in_flight:
+                    continue  # finished CPU stages may have unblocked others
+                if not in_flight:
+                    break  # remaining stages depend on stages that were never scheduled
+
+                now = time.perf_counter()
+                wait = min(started + timeout for _, started, timeout in in_flight.values()) - now
+                if deadline is not None:
+                    wait = min(wait, deadline.remaining())
+                done, _ = concurrent.futures.wait(
+                    in_flight, timeout=max(0.0, wait), return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for future in done:
+                    stage, _, _ = in_flight.pop(future)
+                    finish(stage, *future.result())
+
+                now = time.perf_counter()
+                budget_spent = deadline is not None and deadline.expired()
+                for future, (stage, started, timeout) in list(in_flight.items()):
+                    if budget_spent or now >= started + timeout:
+                        # Completed stages are kept; this one is abandoned and reported as timed out
+                        del in_flight[future]
+                        finish(stage, {'error': expired_message(timeout)}, STATUS_TIMED_OUT, now - started)
+        finally:
+            current_deadline.reset(token)
+            if executor:
+                # Don't block on stragglers; completed stages are already collected
+                executor.shutdown(wait=False, cancel_futures=True)
+
+        # Preserve the declared stage order for reporting
+        ordered = [stage.name for stage in stages if stage.name in results]
+        return (
+            {name: results[name] for name in ordered},
+            {name: round(timings[name], 4) for name in ordered},
+            {name: status[name] for name in ordered},
+        )
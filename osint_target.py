@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Shared target representation for the OSINT reconnaissance tools
+Purpose: Parse and format a phone number once per scan
+"""
+
+
+class ParsedTarget:
+    """Phone number parsed once, with every derived form precomputed"""
+
+    __slots__ = (
+        'raw',
+        'parsed',
+        'valid',
+        'e164',
+        'national',
+        'international',
+        'national_number',
+        'country_code',
+        'region',
+    )
+
+    def __init__(self, raw, parsed):
+        import phonenumbers
+
+        self.raw = raw
+        self.parsed = parsed
+        self.valid = phonenumbers.is_valid_number(parsed)
+        self.e164 = phonenumbers.format_number(parsed, phonenumbers.PhoneNumberFormat.E164)
+        self.national = phonenumbers.format_number(parsed, phonenumbers.PhoneNumberFormat.NATIONAL)
+        self.international = phonenumbers.format_number(parsed, phonenumbers.PhoneNumberFormat.INTERNATIONAL)
+        self.national_number = phonenumbers.national_significant_number(parsed)
+        self.country_code = str(parsed.country_code)
+        self.region = phonenumbers.region_code_for_number(parsed)
+
+    @classmethod
+    def parse(cls, phone_number, region=None):
+        """Parse a raw phone number string, national numbers against region if given (raises NumberParseException)"""
+        # Imported on first parse so --help and early exits skip loading phonenumbers
+        import phonenumbers
+
+        return cls(phone_number, phonenumbers.parse(phone_number, region))
+
+    @classmethod
+    def coerce(cls, value):
+        """Return value unchanged if already parsed, otherwise parse it"""
+        if isinstance(value, cls):
+            return value
+        return cls.parse(value)
+
+    @property
+    def digits(self):
+        """E.164 form without the leading '+'"""
+        return self.e164[1:]
+
+    def __str__(self):
+        return self.e164
+
+    def __repr__(self):
+        return f"ParsedTarget({self.e164!r}, valid={self.valid})"
@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+"""
+HTTP transport for the OSINT reconnaissance tools
+Purpose: Provider-aware requests.Session with caching, pooling, retries and circuit breaking
+"""
+
+import email.utils
+import functools
+import random
+import socket
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError
+
+from osint_cache import cache_key
+from osint_metrics import (BREAKER_TRIPS, CACHE_LOOKUPS, HTTP_LATENCY, HTTP_REQUESTS, HTTP_RETRIES,
+                           PROVIDER_REFUSED, RATE_LIMIT_WAIT)
+from osint_profile import current_http_phases, current_profiler
+from osint_ratelimit import ProviderLimiter, QuotaExhausted
+from osint_scheduler import DeadlineExceeded, current_cache_hits, current_deadline, request_timeout
+
+# Hostname suffix -> provider name used for caching and accounting
+PROVIDER_HOSTS = {
+    'apilayer.net': 'numverify',
+    'haveibeenpwned.com': 'hibp',
+}
+
+# Connection pool per provider endpoint (one scan opens at most a few connections each)
+PROVIDER_POOLS = {
+    'http://apilayer.net': 4,
+    'https://apilayer.net': 4,
+    'https://haveibeenpwned.com': 4,
+}
+
+# Responses worth retrying: rate limiting and transient server errors
+RETRY_STATUSES = frozenset((429, 500, 502, 503, 504))
+
+
+def provider_for_url(url):
+    """Map a request URL to its provider name, or None for unknown hosts"""
+    host = (urlsplit(url).hostname or '').lower()
+    for suffix, provider in PROVIDER_HOSTS.items():
+        if host == suffix or host.endswith('.' + suffix):
+            return provider
+    return None
+
+
+def _endpoint_prefix(url):
+    """scheme://host:port/path of a URL, lowercased up to the path, for matching against moved endpoints"""
+    parts = urlsplit(url)
+    return f'{parts.scheme.lower()}://{parts.netloc.lower()}{parts.path}'
+
+
+def parse_retry_after(value):
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP date)"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+class PhaseTimingMixin:
+    """urllib3 connection that reports DNS, connect and first-byte times while a scan is profiled"""
+
+    def _new_conn(self):
+        phases = current_http_phases.get()
+        if phases is None:
+            return super()._new_conn()
+        host = self._dns_host
+        start = time.perf_counter()
+        try:
+            infos = socket.getaddrinfo(host, self.port, 0, socket.SOCK_STREAM)
+            addresses = list(dict.fromkeys(info[4][0] for info in infos))
+        except OSError:
+            addresses = [host]  # let urllib3 raise its usual NameResolutionError
+        resolved = time.perf_counter()
+        phases['dns'] = resolved - start
+        try:
+            # Connect to the resolved addresses in order, as create_connection would
+            for index, address in enumerate(addresses):
+                self._dns_host = address
+                try:
+                    return super()._new_conn()
+                except ConnectTimeoutError:
+                    if index == len(addresses) - 1:
+                        raise
+        finally:
+            self._dns_host = host
+            phases['connect'] = time.perf_counter() - resolved
+
+    def getresponse(self, *args, **kwargs):
+        phases = current_http_phases.get()
+        if phases is None:
+            return super().getresponse(*args, **kwargs)
+        start = time.perf_counter()
+        response = super().getresponse(*args, **kwargs)
+        # Request sent -> status line and headers parsed
+        phases['first_byte'] = time.perf_counter() - start
+        return response
+
+
+class TimedHTTPConnection(PhaseTimingMixin, HTTPConnection):
+    pass
+
+
+class TimedHTTPSConnection(PhaseTimingMixin, HTTPSConnection):
+
+    def connect(self):
+        phases = current_http_phases.get()
+        if phases is None:
+            return super().connect()
+        start = time.perf_counter()
+        super().connect()
+        # Whatever connect() spent beyond _new_conn() was the TLS handshake
+        phases['tls'] = max(0.0, time.perf_counter() - start - phases.get('dns', 0.0) - phases.get('connect', 0.0))
+
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+
+class ProviderAdapter(HTTPAdapter):
+    """HTTPAdapter whose connections can report phase timings (see osint_profile)"""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {'http': TimedHTTPConnectionPool, 'https': TimedHTTPSConnectionPool}
+
+
+class ProviderUnavailable(requests.RequestException):
+    """Raised instead of calling a provider whose circuit breaker is open"""
+
+
+class CircuitBreaker:
+    """Consecutive-failure breaker for one provider"""
+
+    __slots__ = ('provider', 'threshold', 'reset_after', 'failures', 'opened_at', '_lock')
+
+    def __init__(self, provider, threshold=3, reset_after=None):
+        self.provider = provider
+        self.threshold = threshold
+        self.reset_after = reset_after
+        self.failures = 0
+        self.opened_at = None
+        self._lock = threading.Lock()
+
+    def is_open(self):
+        with self._lock:
+            if self.opened_at is None:
+                return False
+            # Without reset_after the provider stays skipped for the rest of the run
+            if self.reset_after is not None and time.monotonic() - self.opened_at >= self.reset_after:
+                self.opened_at = None
+                self.failures = self.threshold - 1  # half-open: one more failure re-opens
+                return False
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.failures >= self.threshold and self.opened_at is None:
+                self.opened_at = time.monotonic()
+                BREAKER_TRIPS.inc(self.provider)
+
+
+class ReconSession(requests.Session):
+    """requests.Session with response caching, rate limiting, retries and circuit breakers"""
+
+    def __init__(self, cache=None, limiter=None, max_retries=2, backoff_factor=0.5, max_backoff=8.0,
+                 breaker_threshold=3, breaker_reset_after=None, endpoints=None, cassette=None):
+        super().__init__()
+        self.cache = cache
+        self.limiter = limiter if limiter is not None else ProviderLimiter()
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.breaker_threshold = breaker_threshold
+        self.breaker_reset_after = breaker_reset_after
+        self.breakers = {}
+        self._breakers_lock = threading.Lock()
+        # osint_cassette.Cassette recording every provider attempt, or answering them instead of the network
+        self.cassette = cassette
+
+        for prefix, pool_size in PROVIDER_POOLS.items():
+            self.mount(prefix, ProviderAdapter(pool_connections=1, pool_maxsize=pool_size))
+
+        # (scheme://host:port/path prefix, provider) for endpoints moved off the provider's own host
+        # (e.g. local stand-ins), longest first so providers sharing one host:port are told apart by path
+        self.provider_prefixes = []
+        for provider, url in (endpoints or {}).items():
+            prefix = _endpoint_prefix(url)
+            for other_prefix, other in self.provider_prefixes:
+                if other_prefix == prefix:
+                    raise ValueError(f"Endpoints for {other} and {provider} are the same URL ({url})")
+            self.provider_prefixes.append((prefix, provider))
+            parts = urlsplit(url)
+            self.mount(f'{parts.scheme}://{parts.netloc}', ProviderAdapter(pool_connections=1, pool_maxsize=4))
+        self.provider_prefixes.sort(key=lambda item: len(item[0]), reverse=True)
+
+    def provider_for(self, url):
+        """Provider name for a request URL, including moved endpoints"""
+        if self.provider_prefixes:
+            target = _endpoint_prefix(url)
+            for prefix, provider in self.provider_prefixes:
+                if target.startswith(prefix):
+                    return provider
+        return provider_for_url(url)
+
+    def breaker(self, provider):
+        with self._breakers_lock:
+            if provider not in self.breakers:
+                self.breakers[provider] = CircuitBreaker(
+                    provider, self.breaker_threshold, self.breaker_reset_after
+                )
+            return self.breakers[provider]
+
+    def request(self, method, url, *args, **kwargs):
+        provider = self.provider_for(url)
+        if provider is None:
+            if self.cassette is not None and self.cassette.replaying:
+                raise ProviderUnavailable(f'Refusing live request to {urlsplit(url).netloc} while replaying')
+            return super().request(method, url, *args, **kwargs)
+
+        key = None
+        if self.cache is not None and method.upper() == 'GET' and self.cache.handles(provider):
+            key = cache_key(method, url, kwargs.get('params'))
+            response = self.cache.get(provider, key)
+            CACHE_LOOKUPS.inc(provider, 'miss' if response is None else 'hit')
+            if response is not None:
+                hits = current_cache_hits.get()
+                if hits is not None:
+                    hits.add(provider)
+                profiler = current_profiler.get()
+                if profiler is not None:
+                    profiler.record_http(provider, method, url, response.status_code, 0.0, cached=True)
+                return response
+
+        response = self._send_with_retries(provider, method, url, *args, **kwargs)
+        if key is not None:
+            self.cache.store(provider, key, response)
+        return response
+
+    def _attempt(self, provider, method, url, attempt, timeout, *args, **kwargs):
+        """Send one attempt over the network, timing it for a profiled scan and recording it to the cassette"""
+        # Every attempt gets only what is left of the stage's budget (its timeout or the scan deadline)
+        attempt_timeout = request_timeout(timeout) if timeout is not None else None
+        start = time.perf_counter()
+        profiler = current_profiler.get()
+        if profiler is None:
+            response = super().request(method, url, *args, timeout=attempt_timeout, **kwargs)
+        else:
+            send = functools.partial(super().request, method, url, *args, timeout=attempt_timeout, **kwargs)
+            response = profiler.timed_request(provider, method, url, attempt, send)
+        if self.cassette is not None:
+            self.cassette.record(provider, method, url, kwargs.get('params'), response,
+                                 elapsed=time.perf_counter() - start)
+        return response
+
+    def _backoff(self, attempt, response=None):
+        """Delay before the next attempt, honoring Retry-After when the provider sends one"""
+        retry_after = parse_retry_after(response.headers.get('Retry-After')) if response is not None else None
+        if retry_after is not None:
+            return retry_after
+        delay = min(self.max_backoff, self.backoff_factor * (2 ** attempt))
+        return delay * random.uniform(0.5, 1.0)
+
+    def _send_with_retries(self, provider, method, url, *args, **kwargs):
+        breaker = self.breaker(provider)
+        if breaker.is_open():
+            PROVIDER_REFUSED.inc(provider, 'circuit_open')
+            raise ProviderUnavailable(
+                f'{provider} skipped: circuit open after {breaker.failures} consecutive failures'
+            )
+
+        timeout = kwargs.pop('timeout', None)
+        attempt = 0
+        while True:
+            response = error = None
+            replaying = self.cassette is not None and self.cassette.replaying
+            # Paced and counted against the provider's quota; raises rather than overspending.
+            # Replayed attempts never reach the provider, so they cost neither.
+            try:
+                waited = self.limiter.acquire(provider) if not replaying else 0.0
+            except QuotaExhausted:
+                PROVIDER_REFUSED.inc(provider, 'quota')
+                raise
+            except DeadlineExceeded:
+                PROVIDER_REFUSED.inc(provider, 'deadline')
+                raise
+            if waited:
+                RATE_LIMIT_WAIT.inc(provider, amount=waited)
+            start = time.perf_counter()
+            try:
+                if replaying:
+                    response = self.cassette.play(provider, method, url, kwargs.get('params'))
+                else:
+                    response = self._attempt(provider, method, url, attempt, timeout, *args, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                error = e
+                if self.cassette is not None and not replaying:
+                    self.cassette.record(provider, method, url, kwargs.get('params'), error=e,
+                                         elapsed=time.perf_counter() - start)
+            HTTP_LATENCY.observe(time.perf_counter() - start, provider)
+            HTTP_REQUESTS.inc(provider, response.status_code if error is None else type(error).__name__)
+
+            if error is None and response.status_code not in RETRY_STATUSES:
+                breaker.record_success()
+                return response
+
+            delay = self._backoff(attempt, response)
+            deadline = current_deadline.get()
+            # No retry once the budget is spent, or when the backoff alone would spend it
+            out_of_budget = deadline is not None and (deadline.expired() or delay >= deadline.remaining())
+            if attempt >= self.max_retries or delay > self.max_backoff or out_of_budget:
+                breaker.record_failure()
+                if error is not None:
+                    raise error
+                return response
+
+            if response is not None:
+                response.close()
+            if not replaying:
+                time.sleep(delay)
+            attempt += 1
+            HTTP_RETRIES.inc(provider)
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Engagement workspace for the OSINT reconnaissance tools
+Purpose: Keep every scan's stage results with timestamps, re-run only stale stages, and diff against the last run
+
+    python osint_recon_enhanced.py +919876543210 --authorization acme.json --workspace acme.sqlite3
+
+A workspace is a SQLite file. Each scan is stored as a run: the target, the
+engagement it was authorized under, and one row per stage with its status,
+result and the time its data was fetched. A later scan of the same target
+(same engagement, phone and email) reuses every stage whose last successful
+result is younger than the stage's freshness window and runs only the rest.
+Provider stages stay fresh as long as cached responses do (osint_cache
+TTLs); local stages are recomputed on every run, as they cost well under a
+millisecond and follow the current link templates.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from osint_cache import DEFAULT_TTLS
+from osint_engine import STAGE_REGISTRY
+from osint_results import ScanResult, StageResult
+from osint_scheduler import STATUS_OK
+
+
+def parse_stale_after(values):
+    """Parse repeated STAGE=SECONDS / PROVIDER=SECONDS options into a freshness dict"""
+    windows = {}
+    for value in values or ():
+        name, _, seconds = value.partition('=')
+        name = name.strip()
+        if not seconds:
+            raise ValueError(f"Invalid freshness override '{value}', expected STAGE=SECONDS or PROVIDER=SECONDS")
+        if name not in STAGE_REGISTRY and name not in DEFAULT_TTLS:
+            raise ValueError(f"Unknown stage or provider '{name}' in '{value}'")
+        windows[name] = float(seconds)
+    return windows
+
+
+def workspace_from_args(args):
+    """Open the workspace selected by the CLI options, or None"""
+    if not getattr(args, 'workspace', None):
+        return None
+    return Workspace(args.workspace, stale_after=parse_stale_after(args.stale_after), refresh=args.refresh)
+
+
+def _flatten(value, prefix=''):
+    """Dotted path -> leaf value for nested dicts; lists and scalars are leaves"""
+    if isinstance(value, dict) and value:
+        leaves = {}
+        for key, item in value.items():
+            leaves.update(_flatten(item, f'{prefix}.{key}' if prefix else str(key)))
+        return leaves
+    return {prefix: value}
+
+
+def _short(value, width=60):
+    text = json.dumps(value, ensure_ascii=False, default=str)
+    return text if len(text) <= width else text[:width - 3] + '...'
+
+
+def diff_scans(previous, current):
+    """Changes from one ScanResult to the next as (stage, kind, detail) tuples
+
+    kind is 'added' or 'removed' for stages only one run has, 'status' when a
+    stage's status changed, and 'changed' for each differing data field.
+    """
+    changes = []
+    for name in list(previous.stages) + [name for name in current.stages if name not in previous.stages]:
+        before, after = previous.stages.get(name), current.stages.get(name)
+        if before is None:
+            changes.append((name, 'added', after.status))
+        elif after is None:
+            changes.append((name, 'removed', before.status))
+        elif before.status != after.status:
+            changes.append((name, 'status', f'{before.status} -> {after.status}'))
+        elif after.ok:
+            old = _flatten(before.to_dict()['data'])
+            new = _flatten(after.to_dict()['data'])
+            for path in list(old) + [path for path in new if path not in old]:
+                if old.get(path) == new.get(path):
+                    continue
+                label = f'{name}.{path}' if path else name
+                changes.append((label, 'changed', f'{_short(old.get(path))} -> {_short(new.get(path))}'))
+    return changes
+
+
+def describe_diff(changes):
+    """Text lines for diff_scans() output"""
+    if not changes:
+        return 'No changes\n'
+    marks = {'added': '+', 'removed': '-', 'status': '~', 'changed': '~'}
+    return ''.join(f"{marks[kind]} {name}: {detail}\n" for name, kind, detail in changes)
+
+
+class Workspace:
+    """SQLite store of scan runs and their per-stage results"""
+
+    def __init__(self, path, stale_after=None, refresh=False):
+        self.path = path
+        # Stage or provider name -> seconds a successful result stays reusable
+        self.stale_after = dict(stale_after or {})
+        self.refresh = refresh
+        self._lock = threading.Lock()
+
+        if path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.executescript("""
+            CREATE TABLE IF NOT EXISTS runs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                engagement TEXT NOT NULL,
+                phone TEXT NOT NULL,
+                email TEXT NOT NULL,
+                started_at REAL NOT NULL,
+                scan TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS runs_target_started ON runs (engagement, phone, email, started_at);
+            CREATE TABLE IF NOT EXISTS stages (
+                run_id INTEGER NOT NULL REFERENCES runs (id),
+                stage TEXT NOT NULL,
+                status TEXT NOT NULL,
+                fetched_at REAL NOT NULL,
+                reused INTEGER NOT NULL,
+                result TEXT NOT NULL,
+                PRIMARY KEY (run_id, stage)
+            );
+        """)
+        self._db.commit()
+
+    @staticmethod
+    def _target_key(scan):
+        return scan.engagement or '', scan.target['validated_format'], scan.target.get('email') or ''
+
+    def freshness(self, stage):
+        """Seconds a successful result of the stage may be reused (0: always re-run)"""
+        if stage in self.stale_after:
+            return self.stale_after[stage]
+        source = STAGE_REGISTRY[stage].source if stage in STAGE_REGISTRY else 'local'
+        return self.stale_after.get(source, DEFAULT_TTLS.get(source, 0))
+
+    def fresh_results(self, scan, stages, now=None):
+        """Stage name -> (StageResult, fetched_at) for the stages whose last result is still fresh"""
+        if self.refresh:
+            return {}
+        now = time.time() if now is None else now
+        wanted = [name for name in stages if self.freshness(name) > 0]
+        if not wanted:
+            return {}
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT s.stage, s.result, s.fetched_at FROM stages s JOIN runs r ON r.id = s.run_id "
+                "WHERE r.engagement = ? AND r.phone = ? AND r.email = ? AND s.status = ? "
+                f"AND s.stage IN ({','.join('?' * len(wanted))}) ORDER BY s.fetched_at DESC, r.id DESC",
+                (*self._target_key(scan), STATUS_OK, *wanted)
+            ).fetchall()
+        fresh = {}
+        seen = set()
+        for stage, result, fetched_at in rows:
+            if stage in seen:
+                continue
+            # Only the latest successful result counts; an older one is never fresher
+            seen.add(stage)
+            if now - fetched_at < self.freshness(stage):
+                fresh[stage] = (StageResult.from_dict(json.loads(result)), fetched_at)
+        return {name: fresh[name] for name in stages if name in fresh}
+
+    def record(self, scan, started_at, fetched_at, reused=()):
+        """Store a finished scan and return its run id
+
+        started_at is when the scan started (epoch seconds); fetched_at maps
+        each stage to when its data was produced, which for reused stages is
+        the earlier run's fetch time.
+        """
+        summary = scan.to_dict()
+        stages = summary.pop('stages')
+        with self._lock:
+            cursor = self._db.execute(
+                "INSERT INTO runs (engagement, phone, email, started_at, scan) VALUES (?, ?, ?, ?, ?)",
+                (*self._target_key(scan), started_at, json.dumps(summary, ensure_ascii=False))
+            )
+            run_id = cursor.lastrowid
+            self._db.executemany(
+                "INSERT INTO stages VALUES (?, ?, ?, ?, ?, ?)",
+                [(run_id, name, result['status'], fetched_at.get(name, time.time()), int(name in reused),
+                  json.dumps(result, ensure_ascii=False)) for name, result in stages.items()]
+            )
+            self._db.commit()
+        return run_id
+
+    def load_run(self, run_id):
+        """The ScanResult stored as a run, or None"""
+        with self._lock:
+            row = self._db.execute("SELECT scan FROM runs WHERE id = ?", (run_id,)).fetchone()
+            if row is None:
+                return None
+            stages = self._db.execute(
+                "SELECT result FROM stages WHERE run_id = ? ORDER BY rowid", (run_id,)
+            ).fetchall()
+        data = json.loads(row[0])
+        data['stages'] = {}
+        for (result,) in stages:
+            stage = json.loads(result)
+            data['stages'][stage['stage']] = stage
+        data['workspace_run'] = run_id
+        return ScanResult.from_dict(data)
+
+    def previous_run(self, scan):
+        """The run of the same target that started before this scan, as a ScanResult, or None"""
+        query = "SELECT id FROM runs WHERE engagement = ? AND phone = ? AND email = ?"
+        args = list(self._target_key(scan))
+        if scan.workspace_run is not None:
+            # Ordered by start time, not insertion: overlapping scans can finish out of order
+            query += " AND (started_at, id) < (SELECT started_at, id FROM runs WHERE id = ?)"
+            args.append(scan.workspace_run)
+        with self._lock:
+            row = self._db.execute(query + " ORDER BY started_at DESC, id DESC LIMIT 1", args).fetchone()
+        return self.load_run(row[0]) if row else None
+
+    def close(self):
+        with self._lock:
+            self._db.close()